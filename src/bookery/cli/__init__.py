@@ -6,32 +6,36 @@ from pathlib import Path
 
 import click
 
-from bookery.cli.commands import (
-    add_cmd,
-    authors_cmd,
-    collection_cmd,
-    convert_cmd,
-    genre_cmd,
-    info_cmd,
-    inventory_cmd,
-    ls_cmd,
-    mark_cmd,
-    match_cmd,
-    prune_cmd,
-    rematch_cmd,
-    remove_cmd,
-    reveal_cmd,
-    search_cmd,
-    serve_cmd,
-    sync_cmd,
-    tag_cmd,
-    vault_export_cmd,
-    verify_cmd,
-)
+from bookery.cli._lazy_group import LazyGroup
 from bookery.cli.deprecation import deprecated_command_alias
 
+# Subcommand modules are imported on first use; see LazyGroup.
+_COMMANDS = "bookery.cli.commands"
+_LAZY_SUBCOMMANDS = {
+    "add": f"{_COMMANDS}.add_cmd:add_command",
+    "authors": f"{_COMMANDS}.authors_cmd:authors",
+    "collections": f"{_COMMANDS}.collection_cmd:collections",
+    "convert": f"{_COMMANDS}.convert_cmd:convert",
+    "genre": f"{_COMMANDS}.genre_cmd:genre",
+    "info": f"{_COMMANDS}.info_cmd:info",
+    "inventory": f"{_COMMANDS}.inventory_cmd:inventory",
+    "ls": f"{_COMMANDS}.ls_cmd:ls",
+    "mark": f"{_COMMANDS}.mark_cmd:mark",
+    "match": f"{_COMMANDS}.match_cmd:match",
+    "prune": f"{_COMMANDS}.prune_cmd:prune",
+    "rematch": f"{_COMMANDS}.rematch_cmd:rematch",
+    "remove": f"{_COMMANDS}.remove_cmd:remove",
+    "reveal": f"{_COMMANDS}.reveal_cmd:reveal",
+    "search": f"{_COMMANDS}.search_cmd:search",
+    "serve": f"{_COMMANDS}.serve_cmd:serve",
+    "sync": f"{_COMMANDS}.sync_cmd:sync",
+    "tag": f"{_COMMANDS}.tag_cmd:tag",
+    "vault-export": f"{_COMMANDS}.vault_export_cmd:vault_export",
+    "verify": f"{_COMMANDS}.verify_cmd:verify",
+}
+
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_subcommands=_LAZY_SUBCOMMANDS)
 @click.version_option(package_name="bookery")
 @click.option("-v", "--verbose", count=True, help="Increase verbosity (-v info, -vv debug).")
 @click.option(
@@ -59,27 +63,6 @@ def cli(ctx: click.Context, verbose: int, db_path: Path | None) -> None:
     )
 
 
-cli.add_command(add_cmd.add_command)
-cli.add_command(authors_cmd.authors)
-cli.add_command(collection_cmd.collections)
-cli.add_command(convert_cmd.convert)
-cli.add_command(genre_cmd.genre)
-cli.add_command(info_cmd.info)
-cli.add_command(inventory_cmd.inventory)
-cli.add_command(ls_cmd.ls)
-cli.add_command(mark_cmd.mark)
-cli.add_command(match_cmd.match)
-cli.add_command(prune_cmd.prune)
-cli.add_command(rematch_cmd.rematch)
-cli.add_command(remove_cmd.remove)
-cli.add_command(reveal_cmd.reveal)
-cli.add_command(search_cmd.search)
-cli.add_command(serve_cmd.serve)
-cli.add_command(sync_cmd.sync)
-cli.add_command(tag_cmd.tag)
-cli.add_command(vault_export_cmd.vault_export)
-cli.add_command(verify_cmd.verify)
-
 # Deprecated alias for the old `folder` command name. Remove after one release.
 deprecated_command_alias(cli, alias="folder", canonical="reveal")
 
@@ -0,0 +1,38 @@
+# ABOUTME: Click group that imports a subcommand's module only when that command is used.
+# ABOUTME: Keeps `bookery <cmd>` startup from paying for every other command's imports.
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Click group whose subcommands can be registered as ``"module:attribute"`` paths.
+
+    A lazy subcommand's module is imported the first time the command is
+    resolved, so running ``bookery tag ls`` does not import the PDF, web, and
+    conversion stacks that other commands pull in. Listing commands (e.g.
+    ``--help``) still resolves every one of them.
+    """
+
+    def __init__(
+        self, *args: object, lazy_subcommands: dict[str, str] | None = None, **kwargs: object
+    ) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.lazy_subcommands: dict[str, str] = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path = self.lazy_subcommands[cmd_name]
+        module_name, _, attr = import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"lazy subcommand {cmd_name!r} ({import_path}) is not a Click command")
+        return command
@@ -75,7 +75,7 @@ def _print_json(result, missing, target_ext, path, xref):
             "books": [
                 {
                     "name": book.name,
-                    "directory": str(book.directory),
+                    "directory": book.directory,
                     "author": book.author,
                     "title": book.title,
                     "formats": sorted(book.formats),
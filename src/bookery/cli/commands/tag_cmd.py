@@ -1,6 +1,8 @@
 # ABOUTME: The `bookery tag` command group for managing book tags.
 # ABOUTME: Provides add, rm, and ls subcommands for tagging operations.
 
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 
 import click
@@ -19,68 +21,44 @@ def tag() -> None:
     """Manage book tags."""
 
 
-@tag.command("add")
-@click.argument("book_id", type=int)
-@click.argument("tag_name")
-@db_option
-def tag_add(book_id: int, tag_name: str, db_path: Path | None) -> None:
-    """Add a tag to a cataloged book by ID."""
-    # TODO: wrap conn in try-finally or context manager to prevent leak on exception
-    conn = open_library(resolve_db_path(db_path))
+def run_tag_add(conn: sqlite3.Connection, book_id: int, tag_name: str) -> int:
+    """Add tag_name to book book_id on conn and print the outcome. Returns the exit status."""
     catalog = LibraryCatalog(conn)
 
     record = catalog.get_by_id(book_id)
     if record is None:
         console.print(f"[red]Book {book_id} not found.[/red]")
-        conn.close()
-        raise SystemExit(1)
+        return 1
 
     try:
         catalog.add_tag(book_id, tag_name)
     except ValueError as exc:
         console.print(f"[red]{exc}[/red]")
-        conn.close()
-        raise SystemExit(1) from exc
+        return 1
 
     console.print(f"Tagged [bold]{record.metadata.title}[/bold] with [cyan]{tag_name}[/cyan].")
-    conn.close()
+    return 0
 
 
-@tag.command("rm")
-@click.argument("book_id", type=int)
-@click.argument("tag_name")
-@db_option
-def tag_rm(book_id: int, tag_name: str, db_path: Path | None) -> None:
-    """Remove a tag from a cataloged book by ID."""
-    # TODO: wrap conn in try-finally or context manager to prevent leak on exception
-    conn = open_library(resolve_db_path(db_path))
-    catalog = LibraryCatalog(conn)
-
+def run_tag_rm(conn: sqlite3.Connection, book_id: int, tag_name: str) -> int:
+    """Remove tag_name from book book_id on conn and print the outcome. Returns the exit status."""
     try:
-        catalog.remove_tag(book_id, tag_name)
+        LibraryCatalog(conn).remove_tag(book_id, tag_name)
     except ValueError as exc:
         console.print(f"[red]{exc}[/red]")
-        conn.close()
-        raise SystemExit(1) from exc
+        return 1
 
     console.print(f"Removed tag [cyan]{tag_name}[/cyan] from book {book_id}.")
-    conn.close()
+    return 0
 
 
-@tag.command("ls")
-@db_option
-def tag_ls(db_path: Path | None) -> None:
-    """List all tags with book counts."""
-    # TODO: wrap conn in try-finally or context manager to prevent leak on exception
-    conn = open_library(resolve_db_path(db_path))
-    catalog = LibraryCatalog(conn)
-
-    tags = catalog.list_tags()
+def run_tag_ls(conn: sqlite3.Connection) -> int:
+    """Print every tag on conn with its book count. Returns the exit status."""
+    tags = LibraryCatalog(conn).list_tags()
 
     if not tags:
         console.print("[yellow]No tags in the library.[/yellow]")
-        conn.close()
-        return
+        return 0
 
     table = Table()
     table.add_column("Tag", style="cyan")
@@ -90,4 +68,36 @@ def tag_ls(db_path: Path | None) -> None:
         table.add_row(name, str(count))
 
     console.print(table)
-    conn.close()
+    return 0
+
+
+@tag.command("add")
+@click.argument("book_id", type=int)
+@click.argument("tag_name")
+@db_option
+def tag_add(book_id: int, tag_name: str, db_path: Path | None) -> None:
+    """Add a tag to a cataloged book by ID."""
+    with closing(open_library(resolve_db_path(db_path))) as conn:
+        status = run_tag_add(conn, book_id, tag_name)
+    if status:
+        raise SystemExit(status)
+
+
+@tag.command("rm")
+@click.argument("book_id", type=int)
+@click.argument("tag_name")
+@db_option
+def tag_rm(book_id: int, tag_name: str, db_path: Path | None) -> None:
+    """Remove a tag from a cataloged book by ID."""
+    with closing(open_library(resolve_db_path(db_path))) as conn:
+        status = run_tag_rm(conn, book_id, tag_name)
+    if status:
+        raise SystemExit(status)
+
+
+@tag.command("ls")
+@db_option
+def tag_ls(db_path: Path | None) -> None:
+    """List all tags with book counts."""
+    with closing(open_library(resolve_db_path(db_path))) as conn:
+        run_tag_ls(conn)
@@ -1,6 +1,8 @@
 # ABOUTME: The `bookery verify` command for checking library integrity.
 # ABOUTME: Detects missing files and optional hash mismatches across the catalog.
 
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 
 import click
@@ -15,21 +17,9 @@ from bookery.db.connection import open_library
 console = Console()  # TODO: move Console() inside command for testability
 
 
-@click.command("verify")
-@db_option
-@click.option(
-    "--check-hash",
-    is_flag=True,
-    default=False,
-    help="Re-hash source files and compare against stored hashes.",
-)
-def verify(db_path: Path | None, check_hash: bool) -> None:
-    """Verify library integrity: check for missing or changed files."""
-    # TODO: wrap conn in try-finally or context manager to prevent leak on exception
-    conn = open_library(resolve_db_path(db_path))
-    catalog = LibraryCatalog(conn)
-
-    result = verify_library(catalog, check_hash=check_hash)
+def run_verify(conn: sqlite3.Connection, check_hash: bool) -> int:
+    """Verify the catalog on conn, re-hashing sources if check_hash. Returns the exit status."""
+    result = verify_library(LibraryCatalog(conn), check_hash=check_hash)
 
     if result.total_issues > 0:
         table = Table()
@@ -50,8 +40,23 @@ def verify(db_path: Path | None, check_hash: bool) -> None:
         console.print(
             f"\n[red]{result.total_issues} issue(s) found, {result.ok} book(s) verified.[/red]"
         )
-        conn.close()
-        raise SystemExit(1)
+        return 1
 
     console.print(f"[green]All {result.ok} book(s) verified.[/green]")
-    conn.close()
+    return 0
+
+
+@click.command("verify")
+@db_option
+@click.option(
+    "--check-hash",
+    is_flag=True,
+    default=False,
+    help="Re-hash source files and compare against stored hashes.",
+)
+def verify(db_path: Path | None, check_hash: bool) -> None:
+    """Verify library integrity: check for missing or changed files."""
+    with closing(open_library(resolve_db_path(db_path))) as conn:
+        status = run_verify(conn, check_hash)
+    if status:
+        raise SystemExit(status)
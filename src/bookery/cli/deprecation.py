@@ -51,8 +51,9 @@ def deprecated_command_alias(
     Example:
         deprecated_command_alias(cli, alias="import", canonical="add")
     """
-    canonical_cmd = group.get_command(click.Context(group), canonical)
-    if canonical_cmd is None:
+    # Checked by name so a lazily loaded canonical command isn't imported
+    # just to register its alias.
+    if canonical not in group.list_commands(click.Context(group)):
         raise ValueError(
             f"deprecated_command_alias: canonical command '{canonical}' "
             f"not registered on group '{group.name}'"
@@ -78,6 +79,8 @@ def deprecated_command_alias(
     @click.pass_context
     def _alias(ctx: click.Context, args: tuple[str, ...]) -> None:
         _emit_warning(alias, canonical)
+        canonical_cmd = group.get_command(ctx, canonical)
+        assert canonical_cmd is not None
         # Forward to the canonical command. Use ctx.invoke on the parsed
         # subcommand so we stay inside Click's machinery — exit codes,
         # UsageError surface, and stdout/stderr behavior match the canonical
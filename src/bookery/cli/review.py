@@ -41,8 +41,10 @@ class ReviewSession:
         quiet: bool = False,
         threshold: float = 0.8,
         lookup_fn: Callable[[str], MetadataCandidate | None] | None = None,
+        prompt_fn: Callable[..., str] | None = None,
     ) -> None:
         self._console = console or Console()
+        self._prompt = prompt_fn or click.prompt
         self._quiet = quiet
         self._threshold = threshold
         self._lookup_fn = lookup_fn
@@ -118,7 +120,7 @@ class ReviewSession:
         prompt_parts += "  [A] Accept remaining  [S] Skip remaining"
 
         while True:
-            choice = click.prompt(prompt_parts, type=str, default="s")
+            choice = self._prompt(prompt_parts, type=str, default="s")
 
             # Batch shortcuts — case-sensitive (uppercase only)
             if choice == "A":
@@ -202,7 +204,7 @@ class ReviewSession:
         """
         self._show_detail(extracted, candidate)
 
-        detail_choice = click.prompt(
+        detail_choice = self._prompt(
             "[a] Accept  [b] Back to list",
             type=str,
             default="b",
@@ -217,7 +219,7 @@ class ReviewSession:
 
         Returns the candidate's metadata if accepted, or None to go back.
         """
-        url = click.prompt("Enter Open Library URL", type=str)
+        url = self._prompt("Enter Open Library URL", type=str)
         assert self._lookup_fn is not None
         candidate = self._lookup_fn(url)
         if candidate is None:
@@ -74,7 +74,8 @@ def normalize_isbn(isbn: str | None) -> str:
     """
     if not isbn:
         return ""
-    cleaned = re.sub(r"[\s-]", "", isbn)
+    # split() drops exactly the characters regex \s matches, without the regex engine
+    cleaned = "".join(isbn.split()).replace("-", "")
     if not cleaned:
         return ""
 
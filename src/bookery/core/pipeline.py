@@ -2,6 +2,7 @@
 # ABOUTME: Copies EPUB to output directory then writes updated metadata to the copy.
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field, replace
 from pathlib import Path
 
@@ -35,13 +36,19 @@ class WriteResult:
     error: str | None = None
 
 
-def _verify_write(dest: Path, metadata: BookMetadata) -> list[FieldVerification]:
+def _verify_write(
+    dest: Path,
+    metadata: BookMetadata,
+    reader: Callable[[Path], BookMetadata] | None = None,
+) -> list[FieldVerification]:
     """Read back the EPUB at dest and compare fields against metadata.
 
     Only verifies fields that are non-None in metadata. Authors are compared
-    as sorted lists. Language comparison is case-insensitive.
+    as sorted lists. Language comparison is case-insensitive. reader defaults
+    to read_epub_metadata, looked up at call time.
     """
-    read_back = read_epub_metadata(dest)
+    reader = reader or read_epub_metadata
+    read_back = reader(dest)
     verifications: list[FieldVerification] = []
 
     # Title — always verified (title is never None)
@@ -117,6 +124,8 @@ def apply_metadata_safely(
     output_dir: Path,
     *,
     cover_image: bytes | None = None,
+    reader: Callable[[Path], BookMetadata] | None = None,
+    writer: Callable[[Path, BookMetadata], None] | None = None,
 ) -> WriteResult:
     """Copy an EPUB to output_dir and write updated metadata to the copy.
 
@@ -133,10 +142,16 @@ def apply_metadata_safely(
             When supplied, it overrides any ``metadata.cover_image`` so callers
             can fetch a candidate cover lazily and pass it through without
             mutating the candidate's metadata. ``None`` leaves the cover as-is.
+        reader: Reads metadata back for verification. Defaults to
+            read_epub_metadata.
+        writer: Writes metadata into the copy. Defaults to write_epub_metadata.
 
     Returns:
         WriteResult with path, success flag, and verification details.
     """
+    reader = reader or read_epub_metadata
+    writer = writer or write_epub_metadata
+
     dest = build_output_path(metadata, output_dir)
     dest = resolve_collision(dest)
     dest.parent.mkdir(parents=True, exist_ok=True)
@@ -150,7 +165,7 @@ def apply_metadata_safely(
 
     # Write metadata to the copy
     try:
-        write_epub_metadata(dest, metadata)
+        writer(dest, metadata)
     except (OSError, EpubReadError) as exc:
         logger.error("apply_metadata_safely: write failed %s: %s", dest, exc)
         _cleanup_dest(dest)
@@ -158,7 +173,7 @@ def apply_metadata_safely(
 
     # Verify the write by reading back
     try:
-        verifications = _verify_write(dest, metadata)
+        verifications = _verify_write(dest, metadata, reader)
     except (OSError, EpubReadError) as exc:
         # Read-back failed (e.g. missing archive entry from Kobo-modified EPUBs).
         # The write itself succeeded, so keep the file and skip verification.
@@ -3,7 +3,8 @@
 
 import json
 import sqlite3
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -261,11 +262,58 @@ def _compile_term(term: QueryTerm) -> tuple[str, list[object]]:
     raise ValueError(f"Unsupported query field: {field}")  # pragma: no cover
 
 
+# Hashes per `file_hash IN (...)` lookup in add_books_bulk. Well under the
+# 999 bound parameters older SQLite builds allow per statement.
+_ID_LOOKUP_CHUNK_SIZE = 500
+
+
+def _provenance_fields(row: dict[str, object]) -> list[str]:
+    """Columns of a freshly inserted book row that get a provenance entry.
+
+    File-location columns are bookkeeping rather than metadata, and empty
+    values have no source to record.
+    """
+    return [
+        field_name
+        for field_name, value in row.items()
+        if field_name not in {"source_path", "output_path", "file_hash"}
+        and value not in (None, "", "[]", "{}")
+    ]
+
+
 class LibraryCatalog:
     """Wraps a sqlite3 connection and provides typed CRUD for the books table."""
 
     def __init__(self, conn: sqlite3.Connection) -> None:
         self._conn = conn
+        # >0 while inside bulk(); write methods leave the commit to it.
+        self._bulk_depth = 0
+
+    @contextmanager
+    def bulk(self) -> Iterator[None]:
+        """Run a block of catalog writes as a single transaction.
+
+        Write methods normally commit as soon as they finish. Inside this
+        block they don't: everything commits once when the block exits, or
+        rolls back together if it raises. Nested blocks join the outer one.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        except BaseException:
+            if self._bulk_depth == 1:
+                self._conn.rollback()
+            raise
+        else:
+            if self._bulk_depth == 1:
+                self._conn.commit()
+        finally:
+            self._bulk_depth -= 1
+
+    def _commit(self) -> None:
+        """Commit the current write unless a bulk() block will commit it later."""
+        if not self._bulk_depth:
+            self._conn.commit()
 
     def add_book(
         self,
@@ -305,22 +353,103 @@ class LibraryCatalog:
 
         book_id = cursor.lastrowid
         assert book_id is not None
-        for field_name, value in row.items():
-            if field_name in {"source_path", "output_path", "file_hash"}:
-                continue
-            if value in (None, "", "[]", "{}"):
-                continue
+        for field_name in _provenance_fields(row):
             self._upsert_provenance(book_id, field_name, source)
 
-        self._conn.commit()
+        self._commit()
         return book_id  # type: ignore[return-value]
 
+    def add_books_bulk(
+        self,
+        books: list[tuple[BookMetadata, str]],
+        *,
+        source: str = "extracted",
+    ) -> list[int]:
+        """Add many books in one transaction.
+
+        Equivalent to calling ``add_book`` for each ``(metadata, file_hash)``
+        pair, but the book and provenance rows each go in with a single
+        ``executemany``, so the INSERT is prepared once rather than per row.
+        Either every book is added or, on error, none are, including when
+        called inside an enclosing ``bulk()`` block.
+
+        Returns:
+            The row IDs of the inserted books, in input order.
+
+        Raises:
+            DuplicateBookError: If any file_hash already exists in the
+                catalog or repeats within ``books``.
+        """
+        if not books:
+            return []
+
+        with self.bulk():
+            # A savepoint so a failed batch undoes only its own rows, even when
+            # an enclosing bulk() block keeps the transaction open afterwards.
+            self._conn.execute("SAVEPOINT add_books_bulk")
+            try:
+                book_ids = self._insert_books_batch(books, source)
+            except BaseException:
+                self._conn.execute("ROLLBACK TO add_books_bulk")
+                self._conn.execute("RELEASE add_books_bulk")
+                raise
+            self._conn.execute("RELEASE add_books_bulk")
+        return book_ids
+
+    def _insert_books_batch(self, books: list[tuple[BookMetadata, str]], source: str) -> list[int]:
+        """Insert book rows plus their provenance; the body of add_books_bulk."""
+        rows = [metadata_to_row(metadata, file_hash) for metadata, file_hash in books]
+        columns = ", ".join(rows[0].keys())
+        placeholders = ", ".join("?" for _ in rows[0])
+        try:
+            self._conn.executemany(
+                f"INSERT INTO books ({columns}) VALUES ({placeholders})",
+                [list(row.values()) for row in rows],
+            )
+        except sqlite3.IntegrityError as exc:
+            if "UNIQUE constraint failed: books.file_hash" in str(exc):
+                raise DuplicateBookError("One or more books in the batch already exist") from exc
+            raise
+
+        # executemany can't report per-row IDs; file_hash is unique, so
+        # looking the hashes up maps every inserted row back to its ID. The
+        # lookup is chunked to stay under SQLite's bound-parameter limit.
+        hashes = [str(row["file_hash"]) for row in rows]
+        id_by_hash: dict[str, int] = {}
+        for start in range(0, len(hashes), _ID_LOOKUP_CHUNK_SIZE):
+            chunk = hashes[start : start + _ID_LOOKUP_CHUNK_SIZE]
+            hash_placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(
+                f"SELECT id, file_hash FROM books WHERE file_hash IN ({hash_placeholders})",
+                chunk,
+            )
+            id_by_hash.update((r["file_hash"], int(r["id"])) for r in cursor.fetchall())
+        book_ids = [id_by_hash[file_hash] for file_hash in hashes]
+
+        self._conn.executemany(
+            """
+            INSERT INTO book_field_provenance (book_id, field_name, source)
+            VALUES (?, ?, ?)
+            """,
+            [
+                (book_id, field_name, source)
+                for book_id, row in zip(book_ids, rows, strict=True)
+                for field_name in _provenance_fields(row)
+            ],
+        )
+        return book_ids
+
     def get_by_id(self, book_id: int) -> BookRecord | None:
         """Retrieve a book by its row ID."""
         cursor = self._conn.execute("SELECT * FROM books WHERE id = ?", (book_id,))
         row = cursor.fetchone()
         return row_to_record(row) if row else None
 
+    def _book_exists(self, book_id: int) -> bool:
+        """Cheap existence check for validating a book_id before a write."""
+        cursor = self._conn.execute("SELECT 1 FROM books WHERE id = ?", (book_id,))
+        return cursor.fetchone() is not None
+
     def get_by_hash(self, file_hash: str) -> BookRecord | None:
         """Retrieve a book by its file hash."""
         cursor = self._conn.execute("SELECT * FROM books WHERE file_hash = ?", (file_hash,))
@@ -722,7 +851,7 @@ class LibraryCatalog:
             values,
         )
         if cursor.rowcount == 0:
-            self._conn.commit()
+            self._commit()
             raise ValueError(f"Book with id {book_id} not found")
 
         written = list(fields.keys())
@@ -751,7 +880,7 @@ class LibraryCatalog:
                     confidence=confidence,
                 )
 
-        self._conn.commit()
+        self._commit()
 
         # Auto-genre hook: only fires when a provider source is attached,
         # so internal bookkeeping (e.g. store_subjects) doesn't clobber
@@ -815,7 +944,7 @@ class LibraryCatalog:
                 "UPDATE book_field_provenance SET locked = 0 WHERE book_id = ? AND field_name = ?",
                 (book_id, field_name),
             )
-        self._conn.commit()
+        self._commit()
 
     def get_locked_fields(self, book_id: int) -> set[str]:
         """Return the set of field names currently locked on this book."""
@@ -865,7 +994,7 @@ class LibraryCatalog:
                 "UPDATE books SET metadata_matched_at = ? WHERE id = ?",
                 (timestamp, book_id),
             )
-        self._conn.commit()
+        self._commit()
         if cursor.rowcount == 0:
             raise ValueError(f"Book with id {book_id} not found")
 
@@ -876,7 +1005,7 @@ class LibraryCatalog:
             ValueError: If the book_id does not exist.
         """
         cursor = self._conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
-        self._conn.commit()
+        self._commit()
 
         if cursor.rowcount == 0:
             raise ValueError(f"Book with id {book_id} not found")
@@ -889,7 +1018,7 @@ class LibraryCatalog:
         Raises:
             ValueError: If the book_id does not exist.
         """
-        if self.get_by_id(book_id) is None:
+        if not self._book_exists(book_id):
             raise ValueError(f"Book with id {book_id} not found")
 
         self._conn.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag_name,))
@@ -898,7 +1027,7 @@ class LibraryCatalog:
             "SELECT ?, id FROM tags WHERE name = ?",
             (book_id, tag_name),
         )
-        self._conn.commit()
+        self._commit()
 
     def remove_tag(self, book_id: int, tag_name: str) -> None:
         """Remove a tag from a book.
@@ -916,7 +1045,7 @@ class LibraryCatalog:
             "DELETE FROM book_tags WHERE book_id = ? AND tag_id = ?",
             (book_id, tag_id),
         )
-        self._conn.commit()
+        self._commit()
 
         if cursor.rowcount == 0:
             raise ValueError(f"Book {book_id} is not tagged with '{tag_name}'")
@@ -973,7 +1102,7 @@ class LibraryCatalog:
         """
         if not is_canonical_genre(genre_name):
             raise ValueError(f"'{genre_name}' is not a canonical genre")
-        if self.get_by_id(book_id) is None:
+        if not self._book_exists(book_id):
             raise ValueError(f"Book with id {book_id} not found")
 
         cursor = self._conn.execute("SELECT id FROM genres WHERE name = ?", (genre_name,))
@@ -983,7 +1112,7 @@ class LibraryCatalog:
             "INSERT OR IGNORE INTO book_genres (book_id, genre_id, is_primary) VALUES (?, ?, ?)",
             (book_id, genre_id, int(is_primary)),
         )
-        self._conn.commit()
+        self._commit()
 
     def remove_genre(self, book_id: int, genre_name: str) -> None:
         """Remove a genre from a book.
@@ -1001,7 +1130,7 @@ class LibraryCatalog:
             "DELETE FROM book_genres WHERE book_id = ? AND genre_id = ?",
             (book_id, genre_id),
         )
-        self._conn.commit()
+        self._commit()
 
         if cursor.rowcount == 0:
             raise ValueError(f"Genre '{genre_name}' not assigned to book {book_id}")
@@ -1023,7 +1152,7 @@ class LibraryCatalog:
             "UPDATE book_genres SET is_primary = 1 WHERE book_id = ? AND genre_id = ?",
             (book_id, genre_id),
         )
-        self._conn.commit()
+        self._commit()
 
     def get_genres_for_book(self, book_id: int) -> list[tuple[str, bool]]:
         """Get all genres for a book as (name, is_primary) pairs, sorted by name."""
@@ -1133,7 +1262,7 @@ class LibraryCatalog:
             """,
             (kind, serial, label, now),
         )
-        self._conn.commit()
+        self._commit()
         row = self._conn.execute(
             "SELECT id FROM devices WHERE kind = ? AND serial = ?",
             (kind, serial),
@@ -1160,7 +1289,7 @@ class LibraryCatalog:
             """,
             (device_id, book_id, remote_path, now),
         )
-        self._conn.commit()
+        self._commit()
 
     def resolve_book_id_for_remote_path(self, *, device_id: int, remote_path: str) -> int | None:
         """Look up the catalog book id we wrote to `remote_path` on this device."""
@@ -1229,7 +1358,7 @@ class LibraryCatalog:
                 pulled_at,
             ),
         )
-        self._conn.commit()
+        self._commit()
 
     def seed_book_status_if_absent(self, *, book_id: int, status: int, updated_at: str) -> None:
         """Insert book_status only if no row exists for this book.
@@ -1247,7 +1376,7 @@ class LibraryCatalog:
             """,
             (book_id, status, updated_at),
         )
-        self._conn.commit()
+        self._commit()
 
     def merge_book_status_from_device(
         self,
@@ -1283,7 +1412,7 @@ class LibraryCatalog:
             """,
             (book_id, device_status, device_updated_at),
         )
-        self._conn.commit()
+        self._commit()
 
     def set_book_status(self, *, book_id: int, status: int, updated_at: str) -> None:
         """Upsert book_status for the user-write path.
@@ -1295,8 +1424,7 @@ class LibraryCatalog:
         loudly instead of silently writing an orphan row that an FK
         constraint would later complain about anyway.
         """
-        existing = self._conn.execute("SELECT 1 FROM books WHERE id = ?", (book_id,)).fetchone()
-        if existing is None:
+        if not self._book_exists(book_id):
             raise ValueError(f"Book {book_id} not found.")
         self._conn.execute(
             """
@@ -1308,7 +1436,7 @@ class LibraryCatalog:
             """,
             (book_id, status, updated_at),
         )
-        self._conn.commit()
+        self._commit()
 
     def set_book_statuses_bulk(
         self,
@@ -1363,7 +1491,7 @@ class LibraryCatalog:
             """,
             rows,
         )
-        self._conn.commit()
+        self._commit()
         return writable
 
     def get_book_status(self, book_id: int) -> BookStatus | None:
@@ -1572,7 +1700,7 @@ class LibraryCatalog:
             "INSERT INTO collections (name, description, query) VALUES (?, ?, ?)",
             (name, description, query),
         )
-        self._conn.commit()
+        self._commit()
         assert cursor.lastrowid is not None
         return cursor.lastrowid
 
@@ -1655,7 +1783,7 @@ class LibraryCatalog:
             "INSERT OR IGNORE INTO collection_books (collection_id, book_id) VALUES (?, ?)",
             rows,
         )
-        self._conn.commit()
+        self._commit()
 
     def remove_books_from_collection(self, collection_id: int, book_ids: list[int]) -> None:
         """Remove books from a collection.
@@ -1681,7 +1809,7 @@ class LibraryCatalog:
             f"AND book_id IN ({placeholders})",
             [collection_id, *book_ids],
         )
-        self._conn.commit()
+        self._commit()
 
     def list_collections(self) -> list[dict[str, object]]:
         """List all collections with their (live) book counts.
@@ -1835,7 +1963,7 @@ class LibraryCatalog:
             "updated_at = strftime('%Y-%m-%dT%H:%M:%S', 'now') WHERE id = ?",
             (query, collection_id),
         )
-        self._conn.commit()
+        self._commit()
 
     def clear_collection_query(self, collection_id: int) -> None:
         """Convert a rule-based collection to static, snapshotting current members.
@@ -1862,7 +1990,7 @@ class LibraryCatalog:
             "updated_at = strftime('%Y-%m-%dT%H:%M:%S', 'now') WHERE id = ?",
             (collection_id,),
         )
-        self._conn.commit()
+        self._commit()
 
     def _compile_query_member_ids(self, query: QueryNode) -> list[int]:
         """Compile a validated query tree into the matching book IDs.
@@ -1910,7 +2038,7 @@ class LibraryCatalog:
             "DELETE FROM collections WHERE id = ?",
             (collection_id,),
         )
-        self._conn.commit()
+        self._commit()
 
         if cursor.rowcount == 0:
             raise ValueError(f"Collection {collection_id} not found")
@@ -1931,7 +2059,7 @@ class LibraryCatalog:
             "updated_at = strftime('%Y-%m-%dT%H:%M:%S', 'now') WHERE id = ?",
             (new_name, collection_id),
         )
-        self._conn.commit()
+        self._commit()
 
         if cursor.rowcount == 0:
             raise ValueError(f"Collection {collection_id} not found")
@@ -1951,7 +2079,7 @@ class LibraryCatalog:
             "updated_at = strftime('%Y-%m-%dT%H:%M:%S', 'now') WHERE id = ?",
             (description, collection_id),
         )
-        self._conn.commit()
+        self._commit()
 
         if cursor.rowcount == 0:
             raise ValueError(f"Collection {collection_id} not found")
@@ -2029,7 +2157,7 @@ class LibraryCatalog:
                 member_hash,
             ),
         )
-        self._conn.commit()
+        self._commit()
 
     def get_collection_shelf_state(
         self, device_id: int, collection_id: int
@@ -2062,7 +2190,7 @@ class LibraryCatalog:
             "DELETE FROM device_shelf_state WHERE device_id = ? AND collection_id = ?",
             (device_id, collection_id),
         )
-        self._conn.commit()
+        self._commit()
 
     def list_collection_shelf_candidates(self, *, device_id: int) -> list[dict[str, object]]:
         """Return collections that can be pushed as shelves to a device.
@@ -7,7 +7,7 @@ from typing import Any
 
 from bookery.metadata.candidate import MetadataCandidate
 from bookery.metadata.http import HttpClient, MetadataFetchError
-from bookery.metadata.scoring import score_candidate
+from bookery.metadata.scoring import score_candidates
 from bookery.metadata.types import BookMetadata
 from bookery.util.text import strip_html
 
@@ -213,10 +213,10 @@ class GoogleBooksProvider:
             authors=[author] if author else [],
         )
 
+        volumes = [_parse_volume(item) for item in items]
+        confidences = score_candidates(query_meta, volumes)
         candidates: list[MetadataCandidate] = []
-        for item in items:
-            meta = _parse_volume(item)
-            confidence = score_candidate(query_meta, meta)
+        for meta, confidence in zip(volumes, confidences, strict=True):
             source_id = meta.identifiers.get("googlebooks_volume", "unknown")
             candidates.append(
                 MetadataCandidate(
@@ -18,7 +18,7 @@ from bookery.metadata.openlibrary_parser import (
     parse_works_subjects,
     select_best_edition,
 )
-from bookery.metadata.scoring import score_candidate
+from bookery.metadata.scoring import score_candidates
 from bookery.metadata.types import BookMetadata
 
 logger = logging.getLogger(__name__)
@@ -125,9 +125,9 @@ class OpenLibraryProvider:
             authors=[author] if author else [],
         )
 
+        confidences = score_candidates(query_meta, search_metadata)
         candidates = []
-        for meta in search_metadata:
-            confidence = score_candidate(query_meta, meta)
+        for meta, confidence in zip(search_metadata, confidences, strict=True):
             source_id = meta.identifiers.get("openlibrary_work", "unknown")
             candidates.append(
                 MetadataCandidate(
@@ -1,6 +1,8 @@
 # ABOUTME: Confidence scoring for metadata candidate matching.
 # ABOUTME: Compares extracted EPUB metadata against candidates using weighted field similarity.
 
+from collections.abc import Sequence
+from dataclasses import dataclass
 from difflib import SequenceMatcher
 
 from bookery.core.dedup import normalize_isbn as _canonical_isbn
@@ -40,23 +42,40 @@ def _normalize_isbn(isbn: str) -> str:
 
 
 def _string_similarity(a: str, b: str) -> float:
-    """Case-insensitive string similarity using SequenceMatcher."""
+    """String similarity using SequenceMatcher. Inputs are already lowercased."""
     if not a and not b:
         return 1.0
     if not a or not b:
         return 0.0
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    return SequenceMatcher(None, a, b).ratio()
 
 
-def score_candidate(extracted: BookMetadata, candidate: BookMetadata) -> float:
-    """Score how well a candidate matches extracted EPUB metadata.
+@dataclass(frozen=True, slots=True)
+class _MatchKey:
+    """Comparison-ready form of the fields score_candidate matches on.
 
-    Uses weighted comparison across title, author, ISBN, and language.
-    Weights from uncomparable fields (missing on one or both sides) are
-    redistributed proportionally across comparable fields so that a perfect
-    match on available fields scores near 1.0.
-    Returns a float clamped to [0.0, 1.0].
+    Optional fields are None when absent on the metadata, so "comparable"
+    checks stay the same as on the raw values.
     """
+
+    title: str
+    authors: str
+    isbn: str | None
+    language: str | None
+
+
+def _match_key(metadata: BookMetadata) -> _MatchKey:
+    """Normalize a BookMetadata's matched fields once for repeated comparisons."""
+    return _MatchKey(
+        title=metadata.title.lower(),
+        authors=" ".join(_normalize_author(a) for a in metadata.authors),
+        isbn=_normalize_isbn(metadata.isbn) if metadata.isbn else None,
+        language=metadata.language.lower() if metadata.language else None,
+    )
+
+
+def _match_score(extracted: _MatchKey, candidate: _MatchKey) -> float:
+    """Weighted field-match score, before the completeness bonus and clamping."""
     comparable: list[tuple[float, float]] = []
 
     # Title is always comparable (always present on both sides).
@@ -64,32 +83,50 @@ def score_candidate(extracted: BookMetadata, candidate: BookMetadata) -> float:
 
     # Author is comparable if either side has authors.
     # When both sides lack author info, we can't infer a match — skip entirely.
-    extracted_authors = " ".join(_normalize_author(a) for a in extracted.authors)
-    candidate_authors = " ".join(_normalize_author(a) for a in candidate.authors)
-    if extracted_authors or candidate_authors:
+    if extracted.authors or candidate.authors:
         comparable.append(
-            (_WEIGHT_AUTHOR, _string_similarity(extracted_authors, candidate_authors))
+            (_WEIGHT_AUTHOR, _string_similarity(extracted.authors, candidate.authors))
         )
 
     # ISBN is comparable only if both sides have one.
-    if extracted.isbn and candidate.isbn:
-        extracted_isbn = _normalize_isbn(extracted.isbn)
-        candidate_isbn = _normalize_isbn(candidate.isbn)
-        isbn_score = 1.0 if extracted_isbn == candidate_isbn else 0.0
+    if extracted.isbn is not None and candidate.isbn is not None:
+        isbn_score = 1.0 if extracted.isbn == candidate.isbn else 0.0
         comparable.append((_WEIGHT_ISBN, isbn_score))
 
     # Language is comparable only if both sides have one.
-    if extracted.language and candidate.language:
-        lang_score = 1.0 if extracted.language.lower() == candidate.language.lower() else 0.0
+    if extracted.language is not None and candidate.language is not None:
+        lang_score = 1.0 if extracted.language == candidate.language else 0.0
         comparable.append((_WEIGHT_LANGUAGE, lang_score))
 
     # Redistribute: normalize weights so comparable fields sum to 1.0.
     available_weight = sum(w for w, _ in comparable)
-    score = sum(w / available_weight * s for w, s in comparable) if available_weight > 0 else 0.0
+    return sum(w / available_weight * s for w, s in comparable) if available_weight > 0 else 0.0
 
-    score += completeness_bonus(candidate)
 
-    return max(0.0, min(1.0, score))
+def score_candidate(extracted: BookMetadata, candidate: BookMetadata) -> float:
+    """Score how well a candidate matches extracted EPUB metadata.
+
+    Uses weighted comparison across title, author, ISBN, and language.
+    Weights from uncomparable fields (missing on one or both sides) are
+    redistributed proportionally across comparable fields so that a perfect
+    match on available fields scores near 1.0.
+    Returns a float clamped to [0.0, 1.0].
+    """
+    return score_candidates(extracted, [candidate])[0]
+
+
+def score_candidates(extracted: BookMetadata, candidates: Sequence[BookMetadata]) -> list[float]:
+    """Score each candidate against the same extracted metadata.
+
+    Same scores as calling score_candidate per candidate, but the extracted
+    side is normalized once rather than once per candidate.
+    """
+    extracted_key = _match_key(extracted)
+    scores: list[float] = []
+    for candidate in candidates:
+        score = _match_score(extracted_key, _match_key(candidate)) + completeness_bonus(candidate)
+        scores.append(max(0.0, min(1.0, score)))
+    return scores
 
 
 def completeness_bonus(candidate: BookMetadata) -> float:
@@ -1,11 +1,19 @@
 # ABOUTME: Shared pytest fixtures for Bookery tests.
 # ABOUTME: Provides sample EPUB files (valid and corrupt) for testing.
 
+import io
+import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+from click.testing import CliRunner
 from ebooklib import epub
 
+from bookery.db.catalog import LibraryCatalog
+from bookery.db.connection import open_library
+from tests.fixtures.catalog_types import BookSpec, MakeCatalog, OpenLibrary
+
 # Real user paths that tests must never touch. Compared with resolved absolute
 # paths so symlinks and relative segments cannot sneak past the check.
 _REAL_BOOKERY_DIR = (Path.home() / ".bookery").resolve()
@@ -92,15 +100,138 @@ def _isolate_library_root(
     return root
 
 
+@pytest.fixture(scope="session")
+def _library_db_template(tmp_path_factory: pytest.TempPathFactory) -> bytes:
+    """Bytes of a freshly created library database with every migration applied.
+
+    Schema creation runs once per session (per xdist worker); ``library_db``
+    hands each test its own copy instead of re-running the DDL.
+    """
+    path = tmp_path_factory.mktemp("library_template") / "library.db"
+    conn = open_library(path)
+    # Leaving WAL checkpoints everything into the main file and marks the image
+    # as a rollback-journal database, which Connection.deserialize can load.
+    # open_library re-enables WAL on each file copy.
+    conn.execute("PRAGMA journal_mode=DELETE")
+    conn.close()
+    return path.read_bytes()
+
+
+@pytest.fixture
+def library_db(_library_db_template: bytes, tmp_path: Path) -> Path:
+    """Path to a per-test library database that already has the current schema."""
+    path = tmp_path / "library.db"
+    path.write_bytes(_library_db_template)
+    return path
+
+
+def _open_seed_library(path: Path) -> sqlite3.Connection:
+    """``open_library`` with durability turned off, for test setup writes.
+
+    No fsync per commit, and the rollback journal and temp tables stay in
+    memory. WAL is dropped for this connection only: ``open_library``
+    switches it back on when the code under test reopens the file.
+    """
+    conn = open_library(path)
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+@pytest.fixture
+def open_seed_library() -> Iterator[OpenLibrary]:
+    """``open_library`` variant for seeding a file DB before the CLI reads it.
+
+    Connections are closed at teardown, so a test can leave its seed
+    connection open while the CLI reads the file: catalog writes have already
+    committed.
+    """
+    opened: list[sqlite3.Connection] = []
+
+    def _open(path: Path) -> sqlite3.Connection:
+        conn = _open_seed_library(path)
+        opened.append(conn)
+        return conn
+
+    yield _open
+    for conn in opened:
+        conn.close()
+
+
+@pytest.fixture
+def memory_library(_library_db_template: bytes) -> Iterator[sqlite3.Connection]:
+    """In-memory library connection loaded from the migrated template.
+
+    For tests that drive ``LibraryCatalog`` directly and never hand a path to
+    the CLI: commits touch no files. Configured like ``open_library``
+    (``sqlite3.Row`` rows, foreign keys enforced).
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.deserialize(_library_db_template)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys=ON")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def make_catalog(memory_library: sqlite3.Connection) -> MakeCatalog:
+    """Factory that loads the given book specs into a catalog on ``memory_library``.
+
+    All inserts share one transaction, and the output path goes in with the
+    insert rather than through a follow-up ``set_output_path`` update. Tests
+    that need the connection itself (e.g. for ``run_*`` command functions)
+    request ``memory_library`` alongside this fixture.
+    """
+
+    def _make(*books: BookSpec) -> LibraryCatalog:
+        catalog = LibraryCatalog(memory_library)
+        with catalog.bulk():
+            for spec in books:
+                catalog.add_book(*spec)
+        return catalog
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Click CLI test runner shared by the whole session.
+
+    ``CliRunner`` only holds invocation defaults; each ``invoke`` sets up and
+    tears down its own I/O isolation, so one instance is safe to reuse.
+    """
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def dummy_sources(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory holding ``a.epub`` and ``b.epub``, small placeholder source files.
+
+    Shared by the whole session, for tests that only need a cataloged source
+    path to exist. Treat the files as read-only; tests that modify a source
+    file should write their own under ``tmp_path``.
+    """
+    base = tmp_path_factory.mktemp("dummy_sources")
+    (base / "a.epub").write_bytes(b"content a")
+    (base / "b.epub").write_bytes(b"content b")
+    return base
+
+
 @pytest.fixture
 def fixtures_dir() -> Path:
     """Path to the test fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
-def sample_epub(tmp_path: Path) -> Path:
-    """Create a minimal valid EPUB file with known metadata."""
+@pytest.fixture(scope="session")
+def sample_epub_bytes() -> bytes:
+    """Bytes of the canonical sample EPUB, built in memory once per session.
+
+    ``sample_epub`` writes these to a per-test path, so tests that modify their
+    copy can't leak into each other.
+    """
     book = epub.EpubBook()
 
     book.set_identifier("test-isbn-978-0-123456-47-2")
@@ -122,8 +253,16 @@ def sample_epub(tmp_path: Path) -> Path:
     book.add_item(epub.EpubNav())
     book.spine = ["nav", chapter]
 
+    buffer = io.BytesIO()
+    epub.write_epub(buffer, book)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def sample_epub(sample_epub_bytes: bytes, tmp_path: Path) -> Path:
+    """Create a minimal valid EPUB file with known metadata."""
     filepath = tmp_path / "name_of_the_rose.epub"
-    epub.write_epub(str(filepath), book)
+    filepath.write_bytes(sample_epub_bytes)
     return filepath
 
 
@@ -0,0 +1,16 @@
+# ABOUTME: Type aliases for the catalog fixtures defined in tests/conftest.py.
+# ABOUTME: Test modules import these for annotations; conftest itself is never imported.
+
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+from bookery.db.catalog import LibraryCatalog
+from bookery.metadata.types import BookMetadata
+
+# (metadata, file_hash) or (metadata, file_hash, output_path), as add_book takes them
+BookSpec = tuple[BookMetadata, str] | tuple[BookMetadata, str, Path]
+MakeCatalog = Callable[..., LibraryCatalog]
+
+# Signature of the open_seed_library fixture's opener
+OpenLibrary = Callable[[Path], sqlite3.Connection]
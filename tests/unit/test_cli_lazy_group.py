@@ -0,0 +1,116 @@
+# ABOUTME: Unit tests for the lazily loading root CLI group.
+# ABOUTME: Covers deferred subcommand imports, listing, bad import paths, and deprecated aliases.
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from bookery.cli._lazy_group import LazyGroup
+from bookery.cli.deprecation import deprecated_command_alias, reset_deprecation_state
+
+_MODULE_SOURCE = """
+import click
+
+@click.command()
+def hello():
+    click.echo("hello from lazy")
+
+not_a_command = 42
+"""
+
+
+@pytest.fixture()
+def lazy_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Importable module defining one Click command, not yet imported."""
+    name = f"lazy_cmds_{tmp_path.name.replace('-', '_')}"
+    (tmp_path / f"{name}.py").write_text(_MODULE_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    return name
+
+
+def _make_group(lazy_subcommands: dict[str, str]) -> click.Group:
+    @click.group(cls=LazyGroup, lazy_subcommands=lazy_subcommands)
+    def cli() -> None:
+        pass
+
+    @cli.command("eager")
+    def eager() -> None:
+        click.echo("eager")
+
+    return cli
+
+
+def test_module_not_imported_until_command_runs(lazy_module: str) -> None:
+    cli = _make_group({"hello": f"{lazy_module}:hello"})
+    assert lazy_module not in sys.modules
+
+    result = CliRunner().invoke(cli, ["hello"])
+
+    assert result.exit_code == 0
+    assert "hello from lazy" in result.output
+    assert lazy_module in sys.modules
+
+
+def test_list_commands_includes_lazy_and_eager(lazy_module: str) -> None:
+    cli = _make_group({"hello": f"{lazy_module}:hello"})
+
+    assert cli.list_commands(click.Context(cli)) == ["eager", "hello"]
+    assert lazy_module not in sys.modules
+
+
+def test_lazy_command_resolved_once(lazy_module: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeat lookups reuse the registered command instead of re-importing it."""
+    cli = _make_group({"hello": f"{lazy_module}:hello"})
+    first = cli.get_command(click.Context(cli), "hello")
+
+    def _fail(cmd_name: str) -> click.Command:
+        raise AssertionError(f"{cmd_name} loaded twice")
+
+    monkeypatch.setattr(cli, "_load", _fail)
+    assert cli.get_command(click.Context(cli), "hello") is first
+
+
+def test_non_command_attribute_raises(lazy_module: str) -> None:
+    cli = _make_group({"broken": f"{lazy_module}:not_a_command"})
+
+    with pytest.raises(TypeError, match="not a Click command"):
+        cli.get_command(click.Context(cli), "broken")
+
+
+def test_deprecated_alias_defers_canonical_import(lazy_module: str) -> None:
+    reset_deprecation_state()
+    cli = _make_group({"hello": f"{lazy_module}:hello"})
+    deprecated_command_alias(cli, alias="hi", canonical="hello")
+    assert lazy_module not in sys.modules
+
+    result = CliRunner().invoke(cli, ["hi"])
+
+    assert result.exit_code == 0
+    assert "hello from lazy" in result.stdout
+    assert "deprecated" in result.stderr
+
+
+def test_deprecated_alias_rejects_unknown_lazy_canonical() -> None:
+    cli = _make_group({})
+
+    with pytest.raises(ValueError, match="not registered"):
+        deprecated_command_alias(cli, alias="hi", canonical="hello")
+
+
+def test_importing_cli_skips_subcommand_modules() -> None:
+    """The root group imports no subcommand module until one is invoked."""
+    code = (
+        "import sys, bookery.cli; "
+        "print(sorted(m for m in sys.modules if m.startswith('bookery.cli.commands.')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "[]"
@@ -82,6 +82,85 @@ class TestAddBook:
         assert record.output_path == Path("/output/rose.epub")
 
 
+class TestAddBooksBulk:
+    """Tests for LibraryCatalog.add_books_bulk."""
+
+    def test_returns_ids_in_input_order(
+        self, catalog: LibraryCatalog, sample_metadata: BookMetadata
+    ) -> None:
+        """Returned IDs line up with the input pairs."""
+        other = BookMetadata(title="Dune", source_path=Path("/books/dune.epub"))
+        ids = catalog.add_books_bulk([(other, "hash2"), (sample_metadata, "hash1")])
+
+        titles = {record.id: record.metadata.title for record in catalog.list_all()}
+        assert [titles[i] for i in ids] == ["Dune", "The Name of the Rose"]
+
+    def test_records_same_provenance_as_add_book(
+        self, catalog: LibraryCatalog, sample_metadata: BookMetadata
+    ) -> None:
+        """Bulk-added books get the provenance rows add_book would write."""
+        single_id = catalog.add_book(sample_metadata, file_hash="hash1", source="calibre")
+        (bulk_id,) = catalog.add_books_bulk([(sample_metadata, "hash2")], source="calibre")
+
+        single = catalog.get_provenance(single_id)
+        bulk = catalog.get_provenance(bulk_id)
+        assert bulk.keys() == single.keys()
+        assert {entry.source for entry in bulk.values()} == {"calibre"}
+
+    def test_empty_input_returns_empty_list(self, catalog: LibraryCatalog) -> None:
+        """No books means no writes and no IDs."""
+        assert catalog.add_books_bulk([]) == []
+        assert catalog.count_books() == 0
+
+    def test_duplicate_hash_adds_nothing(
+        self, catalog: LibraryCatalog, sample_metadata: BookMetadata
+    ) -> None:
+        """A repeated file_hash raises and leaves no part of the batch behind."""
+        other = BookMetadata(title="Dune", source_path=Path("/books/dune.epub"))
+        with pytest.raises(DuplicateBookError):
+            catalog.add_books_bulk([(other, "hash2"), (sample_metadata, "hash2")])
+
+        assert catalog.count_books() == 0
+
+    def test_duplicate_inside_bulk_block_rolls_back_only_the_batch(
+        self, catalog: LibraryCatalog, tmp_path: Path
+    ) -> None:
+        """A failed batch inside bulk() leaves no rows, while earlier writes still commit."""
+        with catalog.bulk():
+            kept_id = catalog.add_book(
+                BookMetadata(title="Kept", source_path=Path("/kept.epub")), file_hash="kept"
+            )
+            with pytest.raises(DuplicateBookError):
+                catalog.add_books_bulk(
+                    [
+                        (BookMetadata(title="A", source_path=Path("/a.epub")), "h1"),
+                        (BookMetadata(title="B", source_path=Path("/b.epub")), "kept"),
+                    ]
+                )
+
+        assert catalog.get_by_hash("h1") is None
+        other = open_library(tmp_path / "test.db")
+        try:
+            assert [r.id for r in LibraryCatalog(other).list_all()] == [kept_id]
+        finally:
+            other.close()
+
+    def test_id_lookup_spans_chunks(
+        self, catalog: LibraryCatalog, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """IDs stay in input order when the hash lookup is split across statements."""
+        monkeypatch.setattr("bookery.db.catalog._ID_LOOKUP_CHUNK_SIZE", 2)
+        books = [
+            (BookMetadata(title=f"Book {i}", source_path=Path(f"/{i}.epub")), f"hash{i}")
+            for i in range(5)
+        ]
+
+        ids = catalog.add_books_bulk(books)
+
+        hashes = {record.id: record.file_hash for record in catalog.list_all()}
+        assert [hashes[i] for i in ids] == [f"hash{i}" for i in range(5)]
+
+
 class TestGetBy:
     """Tests for get_by_id, get_by_hash, get_by_isbn."""
 
@@ -488,3 +567,60 @@ class TestCounts:
         catalog.create_collection("Favorites")
         catalog.create_collection("To Read", query='status:"unread"')
         assert catalog.count_collections() == 2
+
+
+class TestBulk:
+    """Tests for LibraryCatalog.bulk()."""
+
+    def _other_connection_count(self, tmp_path: Path) -> int:
+        conn = open_library(tmp_path / "test.db")
+        try:
+            return LibraryCatalog(conn).count_books()
+        finally:
+            conn.close()
+
+    def test_writes_commit_once_at_exit(self, catalog: LibraryCatalog, tmp_path: Path) -> None:
+        """Writes inside the block stay uncommitted until it exits."""
+        with catalog.bulk():
+            book_id = catalog.add_book(
+                BookMetadata(title="A", source_path=Path("/A.epub")), file_hash="ha"
+            )
+            catalog.add_tag(book_id, "fiction")
+            catalog.add_book(BookMetadata(title="B", source_path=Path("/B.epub")), file_hash="hb")
+            assert self._other_connection_count(tmp_path) == 0
+
+        assert self._other_connection_count(tmp_path) == 2
+        assert catalog.get_tags_for_book(book_id) == ["fiction"]
+
+    def test_exception_rolls_back_whole_block(self, catalog: LibraryCatalog) -> None:
+        """An error inside the block discards every write made in it."""
+        with pytest.raises(DuplicateBookError), catalog.bulk():
+            catalog.add_book(
+                BookMetadata(title="A", source_path=Path("/A.epub")), file_hash="same"
+            )
+            catalog.add_book(
+                BookMetadata(title="B", source_path=Path("/B.epub")), file_hash="same"
+            )
+
+        assert catalog.count_books() == 0
+
+    def test_nested_block_joins_outer(self, catalog: LibraryCatalog, tmp_path: Path) -> None:
+        """Leaving an inner block doesn't commit; the outer block does."""
+        with catalog.bulk():
+            with catalog.bulk():
+                catalog.add_book(
+                    BookMetadata(title="A", source_path=Path("/A.epub")), file_hash="ha"
+                )
+            assert self._other_connection_count(tmp_path) == 0
+
+        assert self._other_connection_count(tmp_path) == 1
+
+    def test_writes_after_block_commit_immediately(
+        self, catalog: LibraryCatalog, tmp_path: Path
+    ) -> None:
+        """Once the block exits, write methods go back to committing themselves."""
+        with catalog.bulk():
+            pass
+        catalog.add_book(BookMetadata(title="A", source_path=Path("/A.epub")), file_hash="ha")
+
+        assert self._other_connection_count(tmp_path) == 1
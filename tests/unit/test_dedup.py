@@ -195,6 +195,9 @@ class TestNormalizeIsbn:
     def test_strips_spaces(self) -> None:
         assert normalize_isbn("978 0 15 144647 6") == "9780151446476"
 
+    def test_strips_other_whitespace(self) -> None:
+        assert normalize_isbn("978\t0-15\u00a0144647\n6") == "9780151446476"
+
     def test_empty_string(self) -> None:
         assert normalize_isbn("") == ""
 
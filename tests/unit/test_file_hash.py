@@ -1,6 +1,7 @@
 # ABOUTME: Unit tests for SHA-256 file hashing used in deduplication.
 # ABOUTME: Validates determinism, uniqueness, hex format, and error handling.
 
+import hashlib
 import re
 from pathlib import Path
 
@@ -34,6 +35,22 @@ class TestComputeFileHash:
         assert len(result) == 64
         assert re.fullmatch(r"[0-9a-f]{64}", result)
 
+    def test_matches_known_digest(self, tmp_path: Path) -> None:
+        """Digest is plain SHA-256 of the bytes, so tests can hard-code known values."""
+        f = tmp_path / "original.epub"
+        f.write_bytes(b"original")
+        assert (
+            compute_file_hash(f)
+            == "0682c5f2076f099c34cfdd15a9e063849ed437a49677e6fcc5b4198c76575be5"
+        )
+
+    def test_large_file_matches_in_memory_digest(self, tmp_path: Path) -> None:
+        """Files spanning many read blocks hash the same as their bytes in memory."""
+        data = bytes(range(256)) * 4096 + b"tail"
+        f = tmp_path / "large.epub"
+        f.write_bytes(data)
+        assert compute_file_hash(f) == hashlib.sha256(data).hexdigest()
+
     def test_is_deterministic(self, sample_file: Path) -> None:
         """Same file hashed twice yields the same result."""
         hash1 = compute_file_hash(sample_file)
@@ -2,9 +2,12 @@
 # ABOUTME: Uses a FakeHttpClient to test ISBN lookup, search, scoring, and error handling.
 
 import logging
+import re
 from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
+
 from bookery.metadata.http import HttpClient, MetadataFetchError
 from bookery.metadata.openlibrary import OpenLibraryProvider
 from tests.fixtures.openlibrary_responses import (
@@ -38,15 +41,29 @@ class FakeHttpClient:
         return {}
 
 
-class TestOpenLibraryProviderProtocol:
-    """Tests that OpenLibraryProvider satisfies MetadataProvider."""
+# Works descriptions for every doc in SEARCH_RESPONSE_FOUR_DOCS, keyed by works ID.
+_WORKS_DESCRIPTIONS: dict[str, dict[str, Any]] = {
+    "OL456W": {"description": "Desc 1."},
+    "OL789W": {"description": "Desc 2."},
+    "OL101W": {"description": "Desc 3."},
+    "OL202W": {"description": "Desc 4."},
+}
+_WORK_KEY_RE = re.compile(r"/works/(OL\d+W)")
 
-    def test_satisfies_protocol(self) -> None:
-        """OpenLibraryProvider implements the MetadataProvider protocol."""
-        from bookery.metadata.provider import MetadataProvider
 
-        provider = OpenLibraryProvider(http_client=FakeHttpClient())
-        assert isinstance(provider, MetadataProvider)
+def _enriching_get(url: str, params: dict[str, str] | None = None) -> dict[str, Any]:
+    """Serve SEARCH_RESPONSE_FOUR_DOCS plus a description for each works lookup."""
+    if "/search.json" in url:
+        return SEARCH_RESPONSE_FOUR_DOCS
+    match = _WORK_KEY_RE.search(url)
+    return _WORKS_DESCRIPTIONS.get(match.group(1), {}) if match else {}
+
+
+class TestOpenLibraryProviderIdentity:
+    """Tests for OpenLibraryProvider's provider identity.
+
+    Protocol conformance is covered in test_provider_protocol.py.
+    """
 
     def test_name_property(self) -> None:
         """Provider name is 'openlibrary'."""
@@ -204,22 +221,8 @@ class TestSearchByTitleAuthor:
 
     def test_search_enriches_top_candidates_with_descriptions(self) -> None:
         """Top 3 search candidates are enriched with descriptions from works endpoint."""
-        works_responses = {
-            "OL456W": {"description": "Description for OL456W."},
-            "OL789W": {"description": "Description for OL789W."},
-            "OL101W": {"description": "Description for OL101W."},
-        }
-
-        def fake_get(url: str, params: dict[str, str] | None = None) -> dict[str, Any]:
-            if "/search.json" in url:
-                return SEARCH_RESPONSE_FOUR_DOCS
-            for key, data in works_responses.items():
-                if key in url:
-                    return data
-            return {}
-
         client = MagicMock(spec=HttpClient)
-        client.get.side_effect = fake_get
+        client.get.side_effect = _enriching_get
         provider = OpenLibraryProvider(http_client=client)
         results = provider.search_by_title_author("The Name of the Rose", "Umberto Eco")
 
@@ -231,23 +234,8 @@ class TestSearchByTitleAuthor:
 
     def test_search_does_not_enrich_beyond_limit(self) -> None:
         """4th candidate description stays None when enrichment limit is 3."""
-        works_responses = {
-            "OL456W": {"description": "Desc 1."},
-            "OL789W": {"description": "Desc 2."},
-            "OL101W": {"description": "Desc 3."},
-            "OL202W": {"description": "Desc 4."},
-        }
-
-        def fake_get(url: str, params: dict[str, str] | None = None) -> dict[str, Any]:
-            if "/search.json" in url:
-                return SEARCH_RESPONSE_FOUR_DOCS
-            for key, data in works_responses.items():
-                if key in url:
-                    return data
-            return {}
-
         client = MagicMock(spec=HttpClient)
-        client.get.side_effect = fake_get
+        client.get.side_effect = _enriching_get
         provider = OpenLibraryProvider(http_client=client)
         results = provider.search_by_title_author("The Name of the Rose", "Umberto Eco")
 
@@ -390,71 +378,73 @@ class TestEditionEnrichment:
         assert results[0].metadata.isbn is None
 
 
-class TestSubtitleRetry:
-    """Tests for subtitle-stripping retry logic in title/author search."""
-
-    def test_retry_fires_on_empty_results_with_subtitle(self) -> None:
-        """When initial search returns empty and title has subtitle, retry without it."""
-        call_log: list[dict[str, str] | None] = []
+def _make_search_client(
+    first: dict[str, Any], second: dict[str, Any]
+) -> tuple[MagicMock, list[str]]:
+    """Build a client whose first search returns ``first`` and later ones ``second``.
 
-        def fake_get(url: str, params: dict[str, str] | None = None) -> dict[str, Any]:
-            if "/search.json" in url:
-                call_log.append(params)
-                # First call (with subtitle) returns empty, second returns results
-                if params and ":" in params.get("title", ""):
-                    return SEARCH_RESPONSE_EMPTY
-                return SEARCH_RESPONSE
-            return {}
+    Returns the client and a log of the titles sent to the search endpoint.
+    """
+    titles: list[str] = []
 
-        client = MagicMock(spec=HttpClient)
-        client.get.side_effect = fake_get
-        provider = OpenLibraryProvider(http_client=client)
-        results = provider.search_by_title_author("The King's Deception: A Novel")
-
-        assert len(results) == 2
-        assert len(call_log) == 2
-        assert call_log[0] is not None
-        assert call_log[1] is not None
-        assert call_log[0]["title"] == "The King's Deception: A Novel"
-        assert call_log[1]["title"] == "The King's Deception"
-
-    def test_no_retry_when_results_found(self) -> None:
-        """No retry when initial search returns results."""
-        call_count = 0
-
-        def fake_get(url: str, params: dict[str, str] | None = None) -> dict[str, Any]:
-            nonlocal call_count
-            if "/search.json" in url:
-                call_count += 1
-                return SEARCH_RESPONSE
-            return {}
-
-        client = MagicMock(spec=HttpClient)
-        client.get.side_effect = fake_get
-        provider = OpenLibraryProvider(http_client=client)
-        results = provider.search_by_title_author("The Name of the Rose: including Postscript")
+    def fake_get(url: str, params: dict[str, str] | None = None) -> dict[str, Any]:
+        if "/search.json" in url:
+            titles.append((params or {}).get("title", ""))
+            return first if len(titles) == 1 else second
+        return {}
 
-        assert len(results) > 0
-        assert call_count == 1
+    client = MagicMock(spec=HttpClient)
+    client.get.side_effect = fake_get
+    return client, titles
 
-    def test_no_retry_without_subtitle_pattern(self) -> None:
-        """No retry when title doesn't have a subtitle pattern."""
-        call_count = 0
 
-        def fake_get(url: str, params: dict[str, str] | None = None) -> dict[str, Any]:
-            nonlocal call_count
-            if "/search.json" in url:
-                call_count += 1
-                return SEARCH_RESPONSE_EMPTY
-            return {}
+class TestSubtitleRetry:
+    """Tests for subtitle-stripping retry logic in title/author search."""
 
-        client = MagicMock(spec=HttpClient)
-        client.get.side_effect = fake_get
+    @pytest.mark.parametrize(
+        ("title", "first", "second", "expected_titles", "expected_len"),
+        [
+            pytest.param(
+                "The King's Deception: A Novel",
+                SEARCH_RESPONSE_EMPTY,
+                SEARCH_RESPONSE,
+                ["The King's Deception: A Novel", "The King's Deception"],
+                2,
+                id="retry-on-empty-with-subtitle",
+            ),
+            pytest.param(
+                "The Name of the Rose: including Postscript",
+                SEARCH_RESPONSE,
+                SEARCH_RESPONSE,
+                ["The Name of the Rose: including Postscript"],
+                2,
+                id="no-retry-when-results-found",
+            ),
+            pytest.param(
+                "Nonexistent Book",
+                SEARCH_RESPONSE_EMPTY,
+                SEARCH_RESPONSE,
+                ["Nonexistent Book"],
+                0,
+                id="no-retry-without-subtitle",
+            ),
+        ],
+    )
+    def test_subtitle_retry(
+        self,
+        title: str,
+        first: dict[str, Any],
+        second: dict[str, Any],
+        expected_titles: list[str],
+        expected_len: int,
+    ) -> None:
+        """Retry without the subtitle only when the first search comes back empty."""
+        client, titles = _make_search_client(first, second)
         provider = OpenLibraryProvider(http_client=client)
-        results = provider.search_by_title_author("Nonexistent Book")
+        results = provider.search_by_title_author(title)
 
-        assert results == []
-        assert call_count == 1
+        assert len(results) == expected_len
+        assert titles == expected_titles
 
 
 class TestStripSubtitle:
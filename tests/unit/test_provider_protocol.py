@@ -1,8 +1,14 @@
 # ABOUTME: Unit tests for MetadataProvider protocol.
-# ABOUTME: Validates the protocol contract and runtime_checkable behavior.
+# ABOUTME: Validates the protocol contract and that shipped providers satisfy it.
+
+from typing import Any
+
+import pytest
 
 from bookery.metadata import BookMetadata
 from bookery.metadata.candidate import MetadataCandidate
+from bookery.metadata.googlebooks import GoogleBooksProvider
+from bookery.metadata.openlibrary import OpenLibraryProvider
 from bookery.metadata.provider import MetadataProvider
 
 
@@ -32,6 +38,13 @@ class FakeProvider:
         return None
 
 
+class StubHttpClient:
+    """HTTP client stub; providers are only constructed, never queried."""
+
+    def get(self, url: str, params: dict[str, str] | None = None) -> dict[str, Any]:
+        return {}
+
+
 class NotAProvider:
     """Missing required methods — should not satisfy the protocol."""
 
@@ -48,6 +61,12 @@ class TestMetadataProvider:
         provider = FakeProvider()
         assert isinstance(provider, MetadataProvider)
 
+    @pytest.mark.parametrize("provider_cls", [OpenLibraryProvider, GoogleBooksProvider])
+    def test_real_providers_satisfy_protocol(self, provider_cls: type) -> None:
+        """Every shipped HTTP-backed provider satisfies the protocol."""
+        provider = provider_cls(http_client=StubHttpClient())
+        assert isinstance(provider, MetadataProvider)
+
     def test_invalid_implementation_is_not_instance(self) -> None:
         """A class missing required methods does not satisfy the protocol."""
         broken = NotAProvider()
@@ -1,117 +1,152 @@
 # ABOUTME: Unit tests for the ls, info, and search CLI commands.
 # ABOUTME: Validates output format, empty states, and error handling.
 
+import sqlite3
 from pathlib import Path
 
 from click.testing import CliRunner
 
 from bookery.cli import cli
 from bookery.db.catalog import LibraryCatalog
-from bookery.db.connection import open_library
 from bookery.metadata.types import BookMetadata
-
-
-def _seed_catalog(db_path: Path) -> None:
-    """Create a DB and populate it with sample books."""
-    conn = open_library(db_path)
-    catalog = LibraryCatalog(conn)
-
-    catalog.add_book(
-        BookMetadata(
-            title="The Name of the Rose",
-            authors=["Umberto Eco"],
-            language="eng",
-            isbn="9780156001311",
-            description="A mystery in a medieval monastery.",
-            series="Adso of Melk",
-            series_index=1.0,
-            source_path=Path("/books/rose.epub"),
-        ),
-        file_hash="hash_rose",
-    )
-    catalog.add_book(
-        BookMetadata(
-            title="Foucault's Pendulum",
-            authors=["Umberto Eco"],
-            language="eng",
-            description="A conspiracy thriller.",
-            source_path=Path("/books/fp.epub"),
-        ),
-        file_hash="hash_fp",
-    )
-    catalog.add_book(
-        BookMetadata(
-            title="The Alexandria Link",
-            authors=["Steve Berry"],
-            language="eng",
-            series="Cotton Malone",
-            series_index=2.0,
-            source_path=Path("/books/al.epub"),
-        ),
-        file_hash="hash_al",
-    )
-    conn.close()
+from tests.fixtures.catalog_types import OpenLibrary
+
+_SEED_COLUMNS = (
+    "title",
+    "title_sort",
+    "authors",
+    "author_sort",
+    "language",
+    "isbn",
+    "description",
+    "series",
+    "series_index",
+    "source_path",
+    "file_hash",
+)
+
+_SEED_ROWS = [
+    (
+        "The Name of the Rose",
+        "Name of the Rose",
+        '["Umberto Eco"]',
+        "Eco, Umberto",
+        "eng",
+        "9780156001311",
+        "A mystery in a medieval monastery.",
+        "Adso of Melk",
+        1.0,
+        "/books/rose.epub",
+        "hash_rose",
+    ),
+    (
+        "Foucault's Pendulum",
+        "Foucault's Pendulum",
+        '["Umberto Eco"]',
+        "Eco, Umberto",
+        "eng",
+        None,
+        "A conspiracy thriller.",
+        None,
+        None,
+        "/books/fp.epub",
+        "hash_fp",
+    ),
+    (
+        "The Alexandria Link",
+        "Alexandria Link",
+        '["Steve Berry"]',
+        "Berry, Steve",
+        "eng",
+        None,
+        None,
+        "Cotton Malone",
+        2.0,
+        "/books/al.epub",
+        "hash_al",
+    ),
+]
+
+
+def _seed_catalog(conn: sqlite3.Connection) -> None:
+    """Bulk-insert sample books in a single transaction.
+
+    Rows are written straight to the ``books`` table; the read commands under
+    test don't depend on anything ``LibraryCatalog.add_book`` layers on top.
+    """
+    placeholders = ", ".join("?" for _ in _SEED_COLUMNS)
+    with conn:
+        conn.executemany(
+            f"INSERT INTO books ({', '.join(_SEED_COLUMNS)}) VALUES ({placeholders})",
+            _SEED_ROWS,
+        )
 
 
 class TestLsCommand:
     """Tests for bookery ls."""
 
-    def test_ls_shows_all_books(self, tmp_path: Path) -> None:
+    def test_ls_shows_all_books(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """ls lists all cataloged books."""
         db_path = tmp_path / "lib.db"
-        _seed_catalog(db_path)
+        _seed_catalog(open_seed_library(db_path))
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["ls", "--db", str(db_path)])
+        result = runner.invoke(cli, ["ls", "--db", str(db_path)], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "The Name of the Rose" in result.output
         assert "Foucault's Pendulum" in result.output
         assert "The Alexandria Link" in result.output
 
-    def test_ls_shows_author(self, tmp_path: Path) -> None:
+    def test_ls_shows_author(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """ls displays author information."""
         db_path = tmp_path / "lib.db"
-        _seed_catalog(db_path)
+        _seed_catalog(open_seed_library(db_path))
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["ls", "--db", str(db_path)])
+        result = runner.invoke(cli, ["ls", "--db", str(db_path)], catch_exceptions=False)
 
         assert "Umberto Eco" in result.output
         assert "Steve Berry" in result.output
 
-    def test_ls_shows_series(self, tmp_path: Path) -> None:
+    def test_ls_shows_series(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """ls displays series information."""
         db_path = tmp_path / "lib.db"
-        _seed_catalog(db_path)
+        _seed_catalog(open_seed_library(db_path))
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["ls", "--db", str(db_path)])
+        result = runner.invoke(cli, ["ls", "--db", str(db_path)], catch_exceptions=False)
 
         assert "Cotton Malone" in result.output
 
-    def test_ls_series_filter(self, tmp_path: Path) -> None:
+    def test_ls_series_filter(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """ls --series filters to a specific series."""
         db_path = tmp_path / "lib.db"
-        _seed_catalog(db_path)
+        _seed_catalog(open_seed_library(db_path))
 
-        runner = CliRunner()
         result = runner.invoke(
             cli,
             ["ls", "--db", str(db_path), "--series", "Cotton Malone"],
+            catch_exceptions=False,
         )
 
         assert result.exit_code == 0
         assert "The Alexandria Link" in result.output
         assert "The Name of the Rose" not in result.output
 
-    def test_ls_empty_db(self, tmp_path: Path) -> None:
+    def test_ls_empty_db(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """ls shows a message when the library is empty."""
         db_path = tmp_path / "lib.db"
-        open_library(db_path).close()
+        open_seed_library(db_path)
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["ls", "--db", str(db_path)])
+        result = runner.invoke(cli, ["ls", "--db", str(db_path)], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "No books" in result.output
@@ -120,12 +155,13 @@ class TestLsCommand:
 class TestInfoCommand:
     """Tests for bookery info."""
 
-    def test_info_shows_full_detail(self, tmp_path: Path) -> None:
+    def test_info_shows_full_detail(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """info <id> shows all metadata fields."""
         db_path = tmp_path / "lib.db"
-        _seed_catalog(db_path)
+        _seed_catalog(open_seed_library(db_path))
 
-        runner = CliRunner()
         result = runner.invoke(cli, ["info", "1", "--db", str(db_path)])
 
         assert result.exit_code == 0
@@ -134,11 +170,12 @@ class TestInfoCommand:
         assert "9780156001311" in result.output
         assert "medieval monastery" in result.output
 
-    def test_info_renders_subtitle_and_rating(self, tmp_path: Path) -> None:
+    def test_info_renders_subtitle_and_rating(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """info shows subtitle and rating when present."""
         db_path = tmp_path / "lib.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
+        catalog = LibraryCatalog(open_seed_library(db_path))
         catalog.add_book(
             BookMetadata(
                 title="Dune",
@@ -150,21 +187,20 @@ class TestInfoCommand:
             ),
             file_hash="hash_dune",
         )
-        conn.close()
 
-        runner = CliRunner()
         result = runner.invoke(cli, ["info", "1", "--db", str(db_path)])
         assert result.exit_code == 0
         assert "A Novel" in result.output
         assert "4.3" in result.output
         assert "2,145" in result.output
 
-    def test_info_nonexistent_shows_error(self, tmp_path: Path) -> None:
+    def test_info_nonexistent_shows_error(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """info for unknown ID shows an error."""
         db_path = tmp_path / "lib.db"
-        open_library(db_path).close()
+        open_seed_library(db_path)
 
-        runner = CliRunner()
         result = runner.invoke(cli, ["info", "999", "--db", str(db_path)])
 
         assert result.exit_code == 1
@@ -174,35 +210,38 @@ class TestInfoCommand:
 class TestSearchCommand:
     """Tests for bookery search."""
 
-    def test_search_finds_matching_books(self, tmp_path: Path) -> None:
+    def test_search_finds_matching_books(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """search finds books by title keyword."""
         db_path = tmp_path / "lib.db"
-        _seed_catalog(db_path)
+        _seed_catalog(open_seed_library(db_path))
 
-        runner = CliRunner()
         result = runner.invoke(cli, ["search", "Rose", "--db", str(db_path)])
 
         assert result.exit_code == 0
         assert "The Name of the Rose" in result.output
 
-    def test_search_by_author(self, tmp_path: Path) -> None:
+    def test_search_by_author(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """search finds books by author."""
         db_path = tmp_path / "lib.db"
-        _seed_catalog(db_path)
+        _seed_catalog(open_seed_library(db_path))
 
-        runner = CliRunner()
         result = runner.invoke(cli, ["search", "Eco", "--db", str(db_path)])
 
         assert result.exit_code == 0
         assert "The Name of the Rose" in result.output
         assert "Foucault's Pendulum" in result.output
 
-    def test_search_no_results(self, tmp_path: Path) -> None:
+    def test_search_no_results(
+        self, runner: CliRunner, tmp_path: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """search shows a message when nothing matches."""
         db_path = tmp_path / "lib.db"
-        _seed_catalog(db_path)
+        _seed_catalog(open_seed_library(db_path))
 
-        runner = CliRunner()
         result = runner.invoke(
             cli,
             ["search", "zzz_nonexistent", "--db", str(db_path)],
@@ -1,9 +1,12 @@
 # ABOUTME: Unit tests for the interactive review flow.
 # ABOUTME: Tests candidate display, user selection, quiet mode auto-accept, and skip behavior.
 
+import os
+from collections.abc import Iterator
 from io import StringIO
-from unittest.mock import patch
+from typing import Any, TextIO
 
+import pytest
 from rich.console import Console
 
 from bookery.cli.review import ReviewSession
@@ -37,71 +40,116 @@ def _make_candidate(
     )
 
 
+def _make_console(file: TextIO) -> Console:
+    """Build a console writing unstyled output to file.
+
+    Assertions look for plain substrings, so there is no point generating
+    ANSI escape sequences.
+    """
+    return Console(file=file, no_color=True, highlight=False, width=120, legacy_windows=False)
+
+
+@pytest.fixture
+def console() -> Iterator[Console]:
+    """Console for tests that never read what was rendered; output goes to the null device."""
+    with open(os.devnull, "w") as sink:
+        yield _make_console(sink)
+
+
+@pytest.fixture
+def captured_console() -> Console:
+    """Console writing to its own buffer, for tests that inspect rendered output."""
+    return _make_console(StringIO())
+
+
+@pytest.fixture
+def silent_console(console: Console, monkeypatch: pytest.MonkeyPatch) -> Console:
+    """Console whose print is a no-op, for tests that only inspect prompt text.
+
+    The candidate table is still built but never laid out or rendered.
+    """
+    monkeypatch.setattr(console, "print", lambda *args, **kwargs: None)
+    return console
+
+
+class ScriptedPrompt:
+    """Stand-in for click.prompt that hands out canned responses in order.
+
+    Pass an instance as ``ReviewSession(prompt_fn=...)``. Each prompt's text is
+    recorded in ``texts`` as the session asks.
+    """
+
+    def __init__(self, *responses: str) -> None:
+        self._responses = iter(responses)
+        self.texts: list[str] = []
+
+    def __call__(self, text: str, *args: Any, **kwargs: Any) -> str:
+        self.texts.append(text)
+        return next(self._responses)
+
+
+def _rendered(console: Console) -> str:
+    """Return everything written to a fixture console's buffer."""
+    assert isinstance(console.file, StringIO)
+    return console.file.getvalue()
+
+
 class TestReviewSession:
     """Tests for ReviewSession interactive flow."""
 
-    def test_user_selects_candidate(self) -> None:
+    def test_user_selects_candidate(self, console: Console) -> None:
         """User entering '1' selects the first candidate."""
         extracted = BookMetadata(title="Old Title")
         candidates = [
             _make_candidate("New Title", "Author A", 0.9),
             _make_candidate("Alt Title", "Author B", 0.7),
         ]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("1"))
 
-        with patch("bookery.cli.review.click.prompt", return_value="1"):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is not None
         assert result.title == "New Title"
 
-    def test_user_selects_second_candidate(self) -> None:
+    def test_user_selects_second_candidate(self, console: Console) -> None:
         """User entering '2' selects the second candidate."""
         extracted = BookMetadata(title="Old Title")
         candidates = [
             _make_candidate("First", "Author A", 0.9),
             _make_candidate("Second", "Author B", 0.7),
         ]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("2"))
 
-        with patch("bookery.cli.review.click.prompt", return_value="2"):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is not None
         assert result.title == "Second"
 
-    def test_user_skips(self) -> None:
+    def test_user_skips(self, console: Console) -> None:
         """User entering 's' returns None (skip)."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("New Title", "Author A", 0.9)]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("s"))
 
-        with patch("bookery.cli.review.click.prompt", return_value="s"):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is None
 
-    def test_user_keeps_original(self) -> None:
+    def test_user_keeps_original(self, console: Console) -> None:
         """User entering 'k' returns the extracted metadata (keep original)."""
         extracted = BookMetadata(title="Original Title", authors=["Original Author"])
         candidates = [_make_candidate("New Title", "Author A", 0.9)]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("k"))
 
-        with patch("bookery.cli.review.click.prompt", return_value="k"):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is not None
         assert result.title == "Original Title"
 
-    def test_quiet_mode_auto_accepts_high_confidence(self) -> None:
+    def test_quiet_mode_auto_accepts_high_confidence(self, console: Console) -> None:
         """In quiet mode, candidates above threshold are auto-accepted."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("Best Match", "Author A", 0.9)]
-        console = Console(file=StringIO())
         session = ReviewSession(console=console, quiet=True, threshold=0.8)
 
         result = session.review(extracted, candidates)
@@ -109,11 +157,10 @@ class TestReviewSession:
         assert result is not None
         assert result.title == "Best Match"
 
-    def test_quiet_mode_skips_low_confidence(self) -> None:
+    def test_quiet_mode_skips_low_confidence(self, console: Console) -> None:
         """In quiet mode, candidates below threshold are skipped."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("Weak Match", "Author A", 0.5)]
-        console = Console(file=StringIO())
         session = ReviewSession(console=console, quiet=True, threshold=0.8)
 
         result = session.review(extracted, candidates)
@@ -124,7 +171,7 @@ class TestReviewSession:
 class TestDetailView:
     """Tests for the detail view (v<N>) flow."""
 
-    def test_view_detail_then_accept(self) -> None:
+    def test_view_detail_then_accept(self, console: Console) -> None:
         """User enters v1 to view details, then a to accept that candidate."""
         extracted = BookMetadata(title="Old Title")
         candidates = [
@@ -138,47 +185,41 @@ class TestDetailView:
                 description="Cotton Malone investigates.",
             ),
         ]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("v1", "a"))
 
-        with patch("bookery.cli.review.click.prompt", side_effect=["v1", "a"]):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is not None
         assert result.title == "The Templar Legacy"
         assert result.isbn == "9780345504500"
 
-    def test_view_detail_then_back_and_select(self) -> None:
+    def test_view_detail_then_back_and_select(self, console: Console) -> None:
         """User views details, goes back to list, then selects a candidate."""
         extracted = BookMetadata(title="Old Title")
         candidates = [
             _make_candidate("First", "Author A", 0.9, isbn="111"),
             _make_candidate("Second", "Author B", 0.7, isbn="222"),
         ]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("v1", "b", "1"))
 
-        with patch("bookery.cli.review.click.prompt", side_effect=["v1", "b", "1"]):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is not None
         assert result.title == "First"
 
-    def test_view_detail_then_back_and_skip(self) -> None:
+    def test_view_detail_then_back_and_skip(self, console: Console) -> None:
         """User views details, goes back to list, then skips."""
         extracted = BookMetadata(title="Old Title")
         candidates = [
             _make_candidate("First", "Author A", 0.9),
         ]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("v1", "b", "s"))
 
-        with patch("bookery.cli.review.click.prompt", side_effect=["v1", "b", "s"]):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is None
 
-    def test_view_detail_shows_metadata_fields(self) -> None:
+    def test_view_detail_shows_metadata_fields(self, captured_console: Console) -> None:
         """Detail view output contains ISBN, publisher, and description."""
         extracted = BookMetadata(
             title="Old Title",
@@ -197,30 +238,25 @@ class TestDetailView:
                 description="Cotton Malone investigates.",
             ),
         ]
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=120)
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=captured_console, prompt_fn=ScriptedPrompt("v1", "a"))
 
-        with patch("bookery.cli.review.click.prompt", side_effect=["v1", "a"]):
-            session.review(extracted, candidates)
+        session.review(extracted, candidates)
 
-        rendered = output.getvalue()
+        rendered = _rendered(captured_console)
         assert "9780345504500" in rendered
         assert "Ballantine" in rendered
         assert "Cotton Malone investigates." in rendered
 
-    def test_view_invalid_number_reprompts(self) -> None:
+    def test_view_invalid_number_reprompts(self, console: Console) -> None:
         """v99 with only 2 candidates re-shows the prompt."""
         extracted = BookMetadata(title="Old Title")
         candidates = [
             _make_candidate("First", "Author A", 0.9),
             _make_candidate("Second", "Author B", 0.7),
         ]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("v99", "s"))
 
-        with patch("bookery.cli.review.click.prompt", side_effect=["v99", "s"]):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is None
 
@@ -228,7 +264,7 @@ class TestDetailView:
 class TestUrlLookup:
     """Tests for the [u] URL lookup option in review flow."""
 
-    def test_url_lookup_then_accept(self) -> None:
+    def test_url_lookup_then_accept(self, console: Console) -> None:
         """User enters u, pastes URL, lookup returns candidate, user accepts."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("First", "Author A", 0.9)]
@@ -237,20 +273,19 @@ class TestUrlLookup:
         def fake_lookup(url: str) -> MetadataCandidate | None:
             return url_candidate
 
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console, lookup_fn=fake_lookup)
+        session = ReviewSession(
+            console=console,
+            lookup_fn=fake_lookup,
+            prompt_fn=ScriptedPrompt("u", "https://openlibrary.org/works/OL123W", "a"),
+        )
 
-        with patch(
-            "bookery.cli.review.click.prompt",
-            side_effect=["u", "https://openlibrary.org/works/OL123W", "a"],
-        ):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is not None
         assert result.title == "From URL"
         assert result.isbn == "9780000000001"
 
-    def test_url_lookup_failure_reprompts(self) -> None:
+    def test_url_lookup_failure_reprompts(self, captured_console: Console) -> None:
         """lookup_fn returns None, user gets error message, re-prompted."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("First", "Author A", 0.9)]
@@ -258,36 +293,31 @@ class TestUrlLookup:
         def failing_lookup(url: str) -> MetadataCandidate | None:
             return None
 
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=120)
-        session = ReviewSession(console=console, lookup_fn=failing_lookup)
+        prompt = ScriptedPrompt("u", "https://openlibrary.org/works/bad", "s")
+        session = ReviewSession(
+            console=captured_console, lookup_fn=failing_lookup, prompt_fn=prompt
+        )
 
-        with patch(
-            "bookery.cli.review.click.prompt",
-            side_effect=["u", "https://openlibrary.org/works/bad", "s"],
-        ):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is None
-        rendered = output.getvalue()
+        rendered = _rendered(captured_console)
         assert "Could not fetch" in rendered
 
-    def test_url_option_hidden_without_lookup_fn(self) -> None:
+    def test_url_option_hidden_without_lookup_fn(self, silent_console: Console) -> None:
         """[u] option is not shown when no lookup_fn is provided."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("First", "Author A", 0.9)]
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=120)
-        session = ReviewSession(console=console)
+        prompt = ScriptedPrompt("s")
+        session = ReviewSession(console=silent_console, prompt_fn=prompt)
 
-        with patch("bookery.cli.review.click.prompt", return_value="s") as mock_prompt:
-            session.review(extracted, candidates)
+        session.review(extracted, candidates)
 
         # The prompt text should NOT contain [u]
-        prompt_text = mock_prompt.call_args[0][0]
+        prompt_text = prompt.texts[-1]
         assert "[u]" not in prompt_text
 
-    def test_url_option_shown_with_lookup_fn(self) -> None:
+    def test_url_option_shown_with_lookup_fn(self, silent_console: Console) -> None:
         """[u] option IS shown when lookup_fn is provided."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("First", "Author A", 0.9)]
@@ -295,90 +325,80 @@ class TestUrlLookup:
         def dummy_lookup(url: str) -> MetadataCandidate | None:
             return None
 
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console, lookup_fn=dummy_lookup)
+        prompt = ScriptedPrompt("s")
+        session = ReviewSession(console=silent_console, lookup_fn=dummy_lookup, prompt_fn=prompt)
 
-        with patch("bookery.cli.review.click.prompt", return_value="s") as mock_prompt:
-            session.review(extracted, candidates)
+        session.review(extracted, candidates)
 
-        prompt_text = mock_prompt.call_args[0][0]
+        prompt_text = prompt.texts[-1]
         assert "[u]" in prompt_text
 
 
 class TestBatchShortcuts:
     """Tests for batch shortcuts [A] and [S] in review flow."""
 
-    def test_accept_remaining_auto_accepts_above_threshold(self) -> None:
+    def test_accept_remaining_auto_accepts_above_threshold(self, console: Console) -> None:
         """After 'A', next review auto-accepts candidates above threshold."""
         extracted = BookMetadata(title="Old Title")
         high_candidate = [_make_candidate("High Match", "Author A", 0.9)]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console, threshold=0.8)
+        session = ReviewSession(console=console, threshold=0.8, prompt_fn=ScriptedPrompt("A"))
 
         # First review: user enters 'A' to set auto-accept mode
-        with patch("bookery.cli.review.click.prompt", return_value="A"):
-            session.review(extracted, [_make_candidate("First", "Author", 0.85)])
+        session.review(extracted, [_make_candidate("First", "Author", 0.85)])
 
         # Second review: should auto-accept without prompting
         result = session.review(extracted, high_candidate)
         assert result is not None
         assert result.title == "High Match"
 
-    def test_accept_remaining_skips_below_threshold(self) -> None:
+    def test_accept_remaining_skips_below_threshold(self, console: Console) -> None:
         """After 'A', candidates below threshold return None."""
         extracted = BookMetadata(title="Old Title")
         low_candidate = [_make_candidate("Low Match", "Author A", 0.5)]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console, threshold=0.8)
+        session = ReviewSession(console=console, threshold=0.8, prompt_fn=ScriptedPrompt("A"))
 
         # Set auto-accept mode
-        with patch("bookery.cli.review.click.prompt", return_value="A"):
-            session.review(extracted, [_make_candidate("First", "Author", 0.85)])
+        session.review(extracted, [_make_candidate("First", "Author", 0.85)])
 
         # Low confidence should be skipped
         result = session.review(extracted, low_candidate)
         assert result is None
 
-    def test_skip_remaining_skips_all(self) -> None:
+    def test_skip_remaining_skips_all(self, console: Console) -> None:
         """After 'S', next review returns None without prompting."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("Match", "Author A", 0.95)]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("S"))
 
         # Set skip-remaining mode
-        with patch("bookery.cli.review.click.prompt", return_value="S"):
-            session.review(extracted, candidates)
+        session.review(extracted, candidates)
 
         # Next review should skip without prompting
         result = session.review(extracted, candidates)
         assert result is None
 
-    def test_batch_shortcuts_shown_in_prompt(self) -> None:
+    def test_batch_shortcuts_shown_in_prompt(self, silent_console: Console) -> None:
         """Prompt text includes [A] and [S] options."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("First", "Author A", 0.9)]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        prompt = ScriptedPrompt("s")
+        session = ReviewSession(console=silent_console, prompt_fn=prompt)
 
-        with patch("bookery.cli.review.click.prompt", return_value="s") as mock_prompt:
-            session.review(extracted, candidates)
+        session.review(extracted, candidates)
 
-        prompt_text = mock_prompt.call_args[0][0]
+        prompt_text = prompt.texts[-1]
         assert "[A]" in prompt_text
         assert "[S]" in prompt_text
 
-    def test_batch_shortcuts_case_sensitive(self) -> None:
+    def test_batch_shortcuts_case_sensitive(self, console: Console) -> None:
         """Lowercase 'a' does not trigger auto-accept mode."""
         extracted = BookMetadata(title="Old Title")
         candidates = [_make_candidate("First", "Author A", 0.9)]
-        console = Console(file=StringIO())
-        session = ReviewSession(console=console)
+        session = ReviewSession(console=console, prompt_fn=ScriptedPrompt("a", "s"))
 
         # Lowercase 'a' is not a valid prompt option, should reprompt
         # Eventually user enters 's' to skip
-        with patch("bookery.cli.review.click.prompt", side_effect=["a", "s"]):
-            result = session.review(extracted, candidates)
+        result = session.review(extracted, candidates)
 
         assert result is None
         # Verify the auto-accept flag was NOT set
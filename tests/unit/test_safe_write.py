@@ -1,21 +1,45 @@
 # ABOUTME: Unit tests for the non-destructive write pipeline.
 # ABOUTME: Validates copy-then-modify behavior, name collisions, verification, and cleanup.
 
+from contextlib import ExitStack
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
-from bookery.core.pipeline import apply_metadata_safely
+import pytest
+
+from bookery.core.pipeline import _verify_write, apply_metadata_safely
 from bookery.formats.epub import EpubReadError, read_epub_metadata
 from bookery.metadata import BookMetadata
 
 
+@pytest.fixture(scope="session")
+def shared_output(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Output directory shared by tests that only inspect their own result.
+
+    Tests that reuse a title land on a collision-suffixed path, which none of
+    them care about. Tests asserting on collisions or on the directory's
+    contents keep a per-test tmp_path.
+    """
+    return tmp_path_factory.mktemp("outputs")
+
+
+def _failing_writer(path: Path, metadata: BookMetadata) -> None:
+    """Writer stand-in that always fails."""
+    raise EpubReadError("write failed")
+
+
+def _wrong_title_reader(path: Path) -> BookMetadata:
+    """Reader stand-in whose read-back never matches what was written."""
+    return BookMetadata(title="Wrong Title", authors=["Author"])
+
+
 class TestApplyMetadataSafely:
     """Tests for apply_metadata_safely function."""
 
-    def test_creates_copy_in_output_dir(self, sample_epub: Path, tmp_path: Path) -> None:
+    def test_creates_copy_in_output_dir(self, sample_epub: Path, shared_output: Path) -> None:
         """Modified copy is created under the output directory in author/title structure."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
+        output_dir = shared_output
         metadata = BookMetadata(title="Updated Title", authors=["New Author"])
 
         result = apply_metadata_safely(sample_epub, metadata, output_dir)
@@ -24,24 +48,23 @@ class TestApplyMetadataSafely:
         assert str(result.path).startswith(str(output_dir))
         assert result.path.exists()
         assert result.path.suffix == ".epub"
-        # Should be in author subdirectory
-        assert result.path.parent.name != "output"
+        # Should be in an author-sort subdirectory directly under output_dir
+        assert result.path.parent == output_dir / "Author, New"
 
-    def test_original_file_unchanged(self, sample_epub: Path, tmp_path: Path) -> None:
+    def test_original_file_unchanged(
+        self, sample_epub: Path, sample_epub_bytes: bytes, shared_output: Path
+    ) -> None:
         """Original EPUB file is byte-identical after pipeline runs."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        original_bytes = sample_epub.read_bytes()
+        output_dir = shared_output
 
         metadata = BookMetadata(title="Changed Title", authors=["Changed Author"])
         apply_metadata_safely(sample_epub, metadata, output_dir)
 
-        assert sample_epub.read_bytes() == original_bytes
+        assert sample_epub.read_bytes() == sample_epub_bytes
 
-    def test_copy_has_updated_metadata(self, sample_epub: Path, tmp_path: Path) -> None:
+    def test_copy_has_updated_metadata(self, sample_epub: Path, shared_output: Path) -> None:
         """The copy has the new metadata written to it."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
+        output_dir = shared_output
         metadata = BookMetadata(
             title="Il Nome della Rosa",
             authors=["Umberto Eco"],
@@ -55,40 +78,34 @@ class TestApplyMetadataSafely:
         assert read_back.title == "Il Nome della Rosa"
         assert read_back.authors == ["Umberto Eco"]
 
-    def test_name_collision_adds_suffix(self, sample_epub: Path, tmp_path: Path) -> None:
-        """When output file already exists, a numeric suffix is added."""
+    @pytest.mark.parametrize(
+        ("n_existing", "expected_name"),
+        [
+            pytest.param(0, "Test.epub", id="no-collision"),
+            pytest.param(1, "Test_1.epub", id="one-collision"),
+            pytest.param(2, "Test_2.epub", id="two-collisions"),
+        ],
+    )
+    def test_name_collision_suffix(
+        self, sample_epub: Path, tmp_path: Path, n_existing: int, expected_name: str
+    ) -> None:
+        """Each existing file at the organized path bumps the numeric suffix."""
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
         metadata = BookMetadata(title="Test", authors=["Author"])
 
-        # Create the organized path that would collide
-        collision_dir = output_dir / "Author" / "Test.epub"
-        collision_dir.parent.mkdir(parents=True)
-        collision_dir.write_text("occupying the name")
+        # Occupy Test.epub, Test_1.epub, ... under the organized author directory
+        author_dir = output_dir / "Author"
+        author_dir.mkdir(parents=True)
+        for i in range(n_existing):
+            name = "Test.epub" if i == 0 else f"Test_{i}.epub"
+            (author_dir / name).write_text(f"collision {i}")
 
         result = apply_metadata_safely(sample_epub, metadata, output_dir)
 
         assert result.path is not None
         assert result.path.exists()
-        assert result.path.name != "Test.epub"
-        assert "_1" in result.path.stem
-
-    def test_multiple_collisions_increment(self, sample_epub: Path, tmp_path: Path) -> None:
-        """Multiple collisions increment the suffix counter."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        metadata = BookMetadata(title="Test", authors=["Author"])
-
-        # Create the organized path collisions
-        collision_dir = output_dir / "Author"
-        collision_dir.mkdir(parents=True)
-        (collision_dir / "Test.epub").write_text("collision 0")
-        (collision_dir / "Test_1.epub").write_text("collision 1")
-
-        result = apply_metadata_safely(sample_epub, metadata, output_dir)
-
-        assert result.path is not None
-        assert "_2" in result.path.stem
+        assert result.path.parent == author_dir
+        assert result.path.name == expected_name
 
     def test_creates_output_dir_if_missing(self, sample_epub: Path, tmp_path: Path) -> None:
         """Output directory is created if it doesn't exist."""
@@ -100,25 +117,20 @@ class TestApplyMetadataSafely:
         assert output_dir.is_dir()
         assert result.path is not None
         assert result.path.exists()
-
-    def test_preserves_epub_extension(self, sample_epub: Path, tmp_path: Path) -> None:
-        """Output file always has .epub extension."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        metadata = BookMetadata(title="Test")
-
-        result = apply_metadata_safely(sample_epub, metadata, output_dir)
-
-        assert result.path is not None
         assert result.path.suffix == ".epub"
 
 
 class TestWriteBackVerification:
-    """Tests for write-back verification in apply_metadata_safely."""
+    """Tests for write-back verification in apply_metadata_safely.
 
-    def test_result_contains_verified_fields(self, sample_epub: Path, tmp_path: Path) -> None:
+    Tests that write and re-read a real EPUB are marked slow; the failure paths
+    stub the writer or reader and run by default.
+    """
+
+    @pytest.mark.slow
+    def test_result_contains_verified_fields(self, sample_epub: Path, shared_output: Path) -> None:
         """WriteResult has verification entries for written fields."""
-        output_dir = tmp_path / "output"
+        output_dir = shared_output
         metadata = BookMetadata(
             title="Test Title",
             authors=["Test Author"],
@@ -134,9 +146,10 @@ class TestWriteBackVerification:
         assert "authors" in field_names
         assert "language" in field_names
 
-    def test_result_includes_field_details(self, sample_epub: Path, tmp_path: Path) -> None:
+    @pytest.mark.slow
+    def test_result_includes_field_details(self, sample_epub: Path, shared_output: Path) -> None:
         """FieldVerification includes expected and actual values."""
-        output_dir = tmp_path / "output"
+        output_dir = shared_output
         metadata = BookMetadata(title="Verified Title", authors=["Verified Author"])
 
         result = apply_metadata_safely(sample_epub, metadata, output_dir)
@@ -146,58 +159,46 @@ class TestWriteBackVerification:
         assert title_field.actual == "Verified Title"
         assert title_field.passed is True
 
-    def test_write_failure_cleans_up_copy(self, sample_epub: Path, tmp_path: Path) -> None:
-        """If write_epub_metadata raises, the copy is deleted."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        metadata = BookMetadata(title="Test")
-
-        with patch(
-            "bookery.core.pipeline.write_epub_metadata",
-            side_effect=EpubReadError("write failed"),
-        ):
-            result = apply_metadata_safely(sample_epub, metadata, output_dir)
-
-        assert result.success is False
-        assert result.error is not None
-        # The failed copy should be cleaned up
-        assert not list(output_dir.rglob("*.epub"))
-
-    def test_verification_failure_cleans_up_copy(self, sample_epub: Path, tmp_path: Path) -> None:
-        """If read-back returns wrong title, the copy is deleted."""
+    @pytest.mark.parametrize(
+        ("overrides", "stub_copy"),
+        [
+            # The write fails, so the copy never needs real EPUB bytes.
+            pytest.param({"writer": _failing_writer}, True, id="write-failure"),
+            pytest.param({"reader": _wrong_title_reader}, False, id="verification-mismatch"),
+        ],
+    )
+    def test_failure_cleans_up_copy(
+        self,
+        sample_epub: Path,
+        tmp_path: Path,
+        overrides: dict[str, Any],
+        stub_copy: bool,
+    ) -> None:
+        """If the write raises or read-back disagrees, the copy is deleted."""
         output_dir = tmp_path / "output"
         output_dir.mkdir()
         metadata = BookMetadata(title="Expected Title", authors=["Author"])
 
-        wrong_metadata = BookMetadata(title="Wrong Title", authors=["Author"])
-        with patch("bookery.core.pipeline.read_epub_metadata", return_value=wrong_metadata):
-            result = apply_metadata_safely(sample_epub, metadata, output_dir)
+        with ExitStack() as stack:
+            if stub_copy:
+                stack.enter_context(
+                    patch(
+                        "bookery.core.pipeline.copy_file",
+                        side_effect=lambda src, dst: dst.write_bytes(b""),
+                    )
+                )
+            result = apply_metadata_safely(sample_epub, metadata, output_dir, **overrides)
 
         assert result.success is False
+        assert result.error is not None
         assert not list(output_dir.rglob("*.epub"))
 
-    def test_verification_readback_failure_keeps_file(
-        self, sample_epub: Path, tmp_path: Path
+    @pytest.mark.slow
+    def test_only_written_fields_are_verified(
+        self, sample_epub: Path, shared_output: Path
     ) -> None:
-        """If read-back raises, the file is kept (write succeeded, verify skipped)."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        metadata = BookMetadata(title="Test")
-
-        with patch(
-            "bookery.core.pipeline.read_epub_metadata",
-            side_effect=EpubReadError("read failed"),
-        ):
-            result = apply_metadata_safely(sample_epub, metadata, output_dir)
-
-        assert result.success is True
-        assert result.path is not None
-        assert result.path.exists()
-        assert result.verified_fields == []
-
-    def test_only_written_fields_are_verified(self, sample_epub: Path, tmp_path: Path) -> None:
         """None fields are excluded from verification."""
-        output_dir = tmp_path / "output"
+        output_dir = shared_output
         metadata = BookMetadata(
             title="Test Title",
             authors=[],
@@ -215,9 +216,10 @@ class TestWriteBackVerification:
         assert "publisher" not in field_names
         assert "description" not in field_names
 
-    def test_author_order_independence(self, sample_epub: Path, tmp_path: Path) -> None:
+    @pytest.mark.slow
+    def test_author_order_independence(self, sample_epub: Path, shared_output: Path) -> None:
         """Authors verified with sorted comparison — order doesn't matter."""
-        output_dir = tmp_path / "output"
+        output_dir = shared_output
         metadata = BookMetadata(
             title="Test",
             authors=["Bravo Author", "Alpha Author"],
@@ -228,9 +230,10 @@ class TestWriteBackVerification:
         authors_field = next(v for v in result.verified_fields if v.field == "authors")
         assert authors_field.passed is True
 
-    def test_language_case_insensitive(self, sample_epub: Path, tmp_path: Path) -> None:
+    @pytest.mark.slow
+    def test_language_case_insensitive(self, sample_epub: Path, shared_output: Path) -> None:
         """Language verification is case-insensitive ('EN' matches 'en')."""
-        output_dir = tmp_path / "output"
+        output_dir = shared_output
         metadata = BookMetadata(title="Test", authors=["Author"], language="EN")
 
         result = apply_metadata_safely(sample_epub, metadata, output_dir)
@@ -238,9 +241,10 @@ class TestWriteBackVerification:
         lang_field = next(v for v in result.verified_fields if v.field == "language")
         assert lang_field.passed is True
 
-    def test_author_whitespace_tolerance(self, sample_epub: Path, tmp_path: Path) -> None:
+    @pytest.mark.slow
+    def test_author_whitespace_tolerance(self, sample_epub: Path, shared_output: Path) -> None:
         """Author verification strips whitespace before comparing."""
-        output_dir = tmp_path / "output"
+        output_dir = shared_output
         metadata = BookMetadata(
             title="Test",
             authors=["Neil Rackham       "],
@@ -251,17 +255,39 @@ class TestWriteBackVerification:
         authors_field = next(v for v in result.verified_fields if v.field == "authors")
         assert authors_field.passed is True
 
-    def test_verify_readback_failure_keeps_file(self, sample_epub: Path, tmp_path: Path) -> None:
-        """If read-back fails (e.g. missing archive entry), keep the file and warn."""
+    def test_default_reader_resolved_at_call_time(self, sample_epub: Path) -> None:
+        """Patching read_epub_metadata reaches _verify_write's default reader."""
+        metadata = BookMetadata(title="Expected Title")
+
+        with patch("bookery.core.pipeline.read_epub_metadata", _wrong_title_reader):
+            verifications = _verify_write(sample_epub, metadata)
+
+        title_field = next(v for v in verifications if v.field == "title")
+        assert title_field.actual == "Wrong Title"
+        assert title_field.passed is False
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            pytest.param("read failed", id="generic"),
+            pytest.param(
+                "There is no item named 'js/kobo.js' in the archive", id="missing-archive-entry"
+            ),
+        ],
+    )
+    def test_verify_readback_failure_keeps_file(
+        self, sample_epub: Path, tmp_path: Path, error: str
+    ) -> None:
+        """If read-back raises, the file is kept (write succeeded, verify skipped)."""
         output_dir = tmp_path / "output"
         metadata = BookMetadata(title="Test", authors=["Author"])
 
-        with patch(
-            "bookery.core.pipeline.read_epub_metadata",
-            side_effect=EpubReadError("There is no item named 'js/kobo.js' in the archive"),
-        ):
-            result = apply_metadata_safely(sample_epub, metadata, output_dir)
+        def failing_reader(path: Path) -> BookMetadata:
+            raise EpubReadError(error)
+
+        result = apply_metadata_safely(sample_epub, metadata, output_dir, reader=failing_reader)
 
         assert result.success is True
         assert result.path is not None
         assert result.path.exists()
+        assert result.verified_fields == []
@@ -1,8 +1,13 @@
 # ABOUTME: Unit tests for the directory scanner module.
 # ABOUTME: Tests BookEntry, ScanResult dataclasses, Calibre path parsing, and scan logic.
 
+import dataclasses
+import os
+import shutil
 from pathlib import Path
 
+import pytest
+
 from bookery.core.scanner import (
     EBOOK_EXTENSIONS,
     BookEntry,
@@ -28,81 +33,101 @@ class TestBookEntry:
 
     def test_name_with_author_and_title(self):
         entry = BookEntry(
-            directory=Path("/books/Author/Title (123)"),
+            directory="/books/Author/Title (123)",
             author="Umberto Eco",
             title="The Name of the Rose",
-            formats={".epub", ".mobi"},
+            formats=frozenset({".epub", ".mobi"}),
         )
         assert entry.name == "The Name of the Rose - Umberto Eco"
 
     def test_name_without_author(self):
         entry = BookEntry(
-            directory=Path("/books/Unknown/Some Book (1)"),
+            directory="/books/Unknown/Some Book (1)",
             author=None,
             title="Some Book",
-            formats={".epub"},
+            formats=frozenset({".epub"}),
         )
         assert entry.name == "Some Book"
 
     def test_name_without_title(self):
         entry = BookEntry(
-            directory=Path("/books/Author/unknown"),
+            directory="/books/Author/unknown",
             author="Author",
             title=None,
-            formats={".mobi"},
+            formats=frozenset({".mobi"}),
         )
         assert entry.name == "unknown"
 
     def test_name_without_author_or_title(self):
         entry = BookEntry(
-            directory=Path("/books/my-book"),
+            directory="/books/my-book",
             author=None,
             title=None,
-            formats={".pdf"},
+            formats=frozenset({".pdf"}),
         )
         assert entry.name == "my-book"
 
+    def test_directory_path(self):
+        entry = BookEntry(
+            directory="/books/Author/Title (123)",
+            author="Author",
+            title="Title",
+            formats=frozenset({".epub"}),
+        )
+        assert entry.directory_path == Path("/books/Author/Title (123)")
+
     def test_has_format_with_dot(self):
         entry = BookEntry(
-            directory=Path("/books/a"),
+            directory="/books/a",
             author=None,
             title=None,
-            formats={".epub", ".mobi"},
+            formats=frozenset({".epub", ".mobi"}),
         )
         assert entry.has_format(".epub") is True
         assert entry.has_format(".pdf") is False
 
     def test_has_format_without_dot(self):
         entry = BookEntry(
-            directory=Path("/books/a"),
+            directory="/books/a",
             author=None,
             title=None,
-            formats={".epub", ".mobi"},
+            formats=frozenset({".epub", ".mobi"}),
         )
         assert entry.has_format("epub") is True
         assert entry.has_format("pdf") is False
 
     def test_has_format_case_insensitive(self):
         entry = BookEntry(
-            directory=Path("/books/a"),
+            directory="/books/a",
             author=None,
             title=None,
-            formats={".epub"},
+            formats=frozenset({".epub"}),
         )
         assert entry.has_format("EPUB") is True
         assert entry.has_format(".EPUB") is True
         assert entry.has_format("Epub") is True
 
+    def test_frozen_with_slots(self):
+        entry = BookEntry(
+            directory="/books/a",
+            author=None,
+            title="Book",
+            formats=frozenset({".epub"}),
+        )
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.title = "Other"  # type: ignore[misc]
+
 
 class TestScanResult:
     """ScanResult should aggregate BookEntry results with computed properties."""
 
     def _make_entry(self, formats: set[str], title: str = "Book") -> BookEntry:
         return BookEntry(
-            directory=Path(f"/books/{title}"),
+            directory=f"/books/{title}",
             author="Author",
             title=title,
-            formats=formats,
+            formats=frozenset(formats),
         )
 
     def test_total_books(self):
@@ -156,6 +181,19 @@ class TestScanResult:
         missing = result.missing_format(".epub")
         assert len(missing) == 2
 
+    def test_missing_format_repeat_queries_agree(self):
+        mobi_book = self._make_entry({".mobi"}, title="Only MOBI")
+        result = ScanResult(
+            books=[self._make_entry({".epub"}), mobi_book],
+            format_counts={".epub": 1, ".mobi": 1},
+            scan_root=Path("/books"),
+        )
+
+        first = result.missing_format(".epub")
+        first.clear()
+        assert result.missing_format("EPUB") == [mobi_book]
+        assert result.missing_format("epub") == [mobi_book]
+
 
 class TestParseCalibreDir:
     """_parse_calibre_dir extracts author and title from Calibre directory paths."""
@@ -188,6 +226,14 @@ class TestParseCalibreDir:
         _, title = _parse_calibre_dir(book_dir, scan_root=tmp_path)
         assert title == "A Book (Vol 2)"
 
+    def test_non_numeric_trailing_parens_preserved(self, tmp_path):
+        """A trailing parenthetical that isn't all digits is part of the title."""
+        book_dir = tmp_path / "Author" / "A Book (Vol 2)"
+        book_dir.mkdir(parents=True)
+
+        _, title = _parse_calibre_dir(book_dir, scan_root=tmp_path)
+        assert title == "A Book (Vol 2)"
+
     def test_no_calibre_id(self, tmp_path):
         """Directory without trailing (digits) returns dirname as title."""
         author_dir = tmp_path / "Author"
@@ -207,6 +253,12 @@ class TestParseCalibreDir:
         assert author is None
         assert title == "Some Book"
 
+    def test_accepts_path_strings(self):
+        """Plain strings, as produced by the scandir walk, parse like Paths."""
+        author, title = _parse_calibre_dir("/lib/Umberto Eco/Baudolino (7)", scan_root="/lib")
+        assert author == "Umberto Eco"
+        assert title == "Baudolino"
+
 
 class TestScanDirectory:
     """scan_directory walks a tree and groups ebook files by leaf directory."""
@@ -249,6 +301,18 @@ class TestScanDirectory:
         # Directory with no ebook files should not be counted as a book
         assert result.total_books == 0
 
+    def test_extension_matching(self, tmp_path):
+        """Extensions match case-insensitively on the last suffix; dotfiles don't count."""
+        book_dir = tmp_path / "Author" / "Book (1)"
+        book_dir.mkdir(parents=True)
+        (book_dir / "Book.v2.MOBI").write_bytes(b"fake")
+        (book_dir / ".epub").write_bytes(b"hidden")
+        (book_dir / "notes.epub.bak").write_bytes(b"backup")
+
+        result = scan_directory(tmp_path)
+        assert result.total_books == 1
+        assert result.books[0].formats == {".mobi"}
+
     def test_format_counts(self, calibre_tree):
         result = scan_directory(calibre_tree)
         assert result.format_counts[".epub"] == 1
@@ -268,6 +332,20 @@ class TestScanDirectory:
         dune = by_title["Dune"]
         assert dune.author == "Frank Herbert"
 
+    def test_books_share_author_and_format_strings(self, tmp_path):
+        """Books by the same author reuse one author string and canonical extensions."""
+        for title in ("First (1)", "Second (2)"):
+            book_dir = tmp_path / "Author" / title
+            book_dir.mkdir(parents=True)
+            (book_dir / "book.EPUB").write_bytes(b"fake")
+
+        first, second = scan_directory(tmp_path).books
+        assert first.author is second.author
+        (first_ext,) = first.formats
+        (second_ext,) = second.formats
+        assert first_ext is second_ext
+        assert first_ext in EBOOK_EXTENSIONS
+
     def test_scan_root_is_set(self, calibre_tree):
         result = scan_directory(calibre_tree)
         assert result.scan_root == calibre_tree
@@ -283,3 +361,53 @@ class TestScanDirectory:
 
         result = scan_directory(tmp_path)
         assert result.total_books == 1
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path):
+        """A symlink to a book directory is not counted as a second book."""
+        book_dir = tmp_path / "Author" / "Book (1)"
+        book_dir.mkdir(parents=True)
+        (book_dir / "book.epub").write_bytes(b"fake")
+        (tmp_path / "Shortcut").symlink_to(tmp_path / "Author", target_is_directory=True)
+
+        result = scan_directory(tmp_path)
+        assert result.total_books == 1
+        assert result.books[0].directory == str(book_dir)
+
+    def test_parallel_walk_matches_sequential(self, calibre_tree, monkeypatch):
+        """Walking top-level subtrees on a thread pool finds the same books."""
+        sequential = scan_directory(calibre_tree)
+
+        monkeypatch.setattr("bookery.core.scanner._PARALLEL_SCAN_MIN_SUBDIRS", 1)
+        parallel = scan_directory(calibre_tree)
+
+        assert parallel == sequential
+
+    def test_missing_root_finds_nothing(self, tmp_path):
+        result = scan_directory(tmp_path / "does-not-exist")
+        assert result.total_books == 0
+
+    def test_file_root_finds_nothing(self, tmp_path):
+        not_a_dir = tmp_path / "book.epub"
+        not_a_dir.write_bytes(b"fake")
+
+        result = scan_directory(not_a_dir)
+        assert result.total_books == 0
+
+    def test_directory_removed_mid_walk_is_skipped(self, tmp_path, monkeypatch):
+        """A subdirectory deleted after it was listed but before it is read is skipped."""
+        for title in ("Kept (1)", "Doomed (2)"):
+            book_dir = tmp_path / "Author" / title
+            book_dir.mkdir(parents=True)
+            (book_dir / "book.epub").write_bytes(b"fake")
+        doomed = str(tmp_path / "Author" / "Doomed (2)")
+        real_scandir = os.scandir
+
+        def scandir_removing_doomed(path):
+            if path == doomed:
+                shutil.rmtree(doomed)
+            return real_scandir(path)
+
+        monkeypatch.setattr("bookery.core.scanner.os.scandir", scandir_removing_doomed)
+
+        result = scan_directory(tmp_path)
+        assert [book.title for book in result.books] == ["Kept"]
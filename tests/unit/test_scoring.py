@@ -1,8 +1,10 @@
 # ABOUTME: Unit tests for metadata candidate scoring logic.
 # ABOUTME: Validates weighted field comparisons, normalization, and edge cases.
 
+import pytest
+
 from bookery.metadata import BookMetadata
-from bookery.metadata.scoring import completeness_bonus, score_candidate
+from bookery.metadata.scoring import completeness_bonus, score_candidate, score_candidates
 
 
 class TestScoreCandidate:
@@ -236,3 +238,42 @@ class TestCompletenessBonus:
         one_field = BookMetadata(title="Test", description="Desc.")
         two_fields = BookMetadata(title="Test", description="Desc.", isbn="123")
         assert completeness_bonus(two_fields) > completeness_bonus(one_field)
+
+
+class TestScoreCandidates:
+    """Tests for batch scoring against a single extracted record."""
+
+    def test_scores_fixed_candidates(self) -> None:
+        """Batch scores match hand-computed weighted scores, in input order.
+
+        Weights are title 0.4, author 0.3, ISBN 0.2, language 0.1, renormalized
+        over the fields both sides can compare, plus the completeness bonus.
+        """
+        extracted = BookMetadata(
+            title="The Name of the Rose",
+            authors=["Eco, Umberto"],
+            isbn="0-15-144647-4",
+            language="EN",
+        )
+        candidates = [
+            # Exact title and author: 1.0, plus a 0.015 author bonus clamped away
+            BookMetadata(title="The Name of the Rose", authors=["Umberto Eco"]),
+            # Fuzzy title (SequenceMatcher ratio 40/49), exact author, 0.015 bonus
+            BookMetadata(title="The Name of the Rose: A Novel", authors=["Umberto Eco"]),
+            # Only the ISBN (ISBN-10 vs its ISBN-13 form) matches; 0.03 ISBN bonus
+            BookMetadata(title="XYZ", authors=[], isbn="9780151446476"),
+            # Empty title and authors match nothing and earn no bonus
+            BookMetadata(title="", authors=[]),
+        ]
+
+        scores = score_candidates(extracted, candidates)
+
+        assert scores == [
+            1.0,
+            pytest.approx((0.4 * 40 / 49 + 0.3 * 1.0) / 0.7 + 0.015),
+            pytest.approx(0.2 / 0.9 + 0.03),
+            0.0,
+        ]
+
+    def test_empty_candidates(self) -> None:
+        assert score_candidates(BookMetadata(title="Anything"), []) == []
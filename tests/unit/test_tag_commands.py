@@ -1,43 +1,46 @@
 # ABOUTME: Unit tests for the `bookery tag` CLI command group.
-# ABOUTME: Tests tag add, rm, and ls subcommands via Click's CliRunner.
+# ABOUTME: Tests tag add, rm, and ls logic directly, with one CliRunner smoke test per command.
 
+import sqlite3
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from bookery.cli import cli
+from bookery.cli.commands.tag_cmd import run_tag_add, run_tag_ls, run_tag_rm
 from bookery.db.catalog import LibraryCatalog
-from bookery.db.connection import open_library
 from bookery.metadata.types import BookMetadata
+from tests.fixtures.catalog_types import OpenLibrary
 
 
 class TestTagAdd:
     """Tests for `bookery tag add`."""
 
-    def test_tag_add_success(self, tmp_path: Path) -> None:
+    def test_tag_add_success(
+        self, memory_library: sqlite3.Connection, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Adding a tag to a book succeeds with confirmation message."""
-        db_path = tmp_path / "test.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-        catalog.add_book(
+        LibraryCatalog(memory_library).add_book(
             BookMetadata(title="Test Book", source_path=Path("/test.epub")),
             file_hash="hash1",
         )
-        conn.close()
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["tag", "add", "1", "fiction", "--db", str(db_path)])
-        assert result.exit_code == 0
-        assert "fiction" in result.output
-        assert "Test Book" in result.output
+        assert run_tag_add(memory_library, 1, "fiction") == 0
+        output = capsys.readouterr().out
+        assert "fiction" in output
+        assert "Test Book" in output
 
-    def test_tag_add_nonexistent_book(self, tmp_path: Path) -> None:
+    def test_tag_add_nonexistent_book(
+        self, memory_library: sqlite3.Connection, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Adding a tag to a nonexistent book shows an error."""
-        db_path = tmp_path / "test.db"
-        open_library(db_path).close()
+        assert run_tag_add(memory_library, 999, "fiction") == 1
+        assert "not found" in capsys.readouterr().out
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["tag", "add", "999", "fiction", "--db", str(db_path)])
+    def test_tag_add_cli_exit_code(self, runner: CliRunner, library_db: Path) -> None:
+        """The Click command maps a failed add to exit code 1."""
+        result = runner.invoke(cli, ["tag", "add", "999", "fiction", "--db", str(library_db)])
         assert result.exit_code == 1
         assert "not found" in result.output
 
@@ -45,36 +48,36 @@ class TestTagAdd:
 class TestTagRm:
     """Tests for `bookery tag rm`."""
 
-    def test_tag_rm_success(self, tmp_path: Path) -> None:
+    def test_tag_rm_success(
+        self, memory_library: sqlite3.Connection, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Removing a tag from a book succeeds with confirmation."""
-        db_path = tmp_path / "test.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-        catalog.add_book(
-            BookMetadata(title="Test Book", source_path=Path("/test.epub")),
-            file_hash="hash1",
-        )
-        catalog.add_tag(1, "fiction")
-        conn.close()
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["tag", "rm", "1", "fiction", "--db", str(db_path)])
-        assert result.exit_code == 0
-        assert "Removed" in result.output
-
-    def test_tag_rm_nonexistent_tag(self, tmp_path: Path) -> None:
+        catalog = LibraryCatalog(memory_library)
+        with catalog.bulk():
+            catalog.add_book(
+                BookMetadata(title="Test Book", source_path=Path("/test.epub")),
+                file_hash="hash1",
+            )
+            catalog.add_tag(1, "fiction")
+
+        assert run_tag_rm(memory_library, 1, "fiction") == 0
+        assert "Removed" in capsys.readouterr().out
+
+    def test_tag_rm_nonexistent_tag(
+        self, memory_library: sqlite3.Connection, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Removing a nonexistent tag shows an error."""
-        db_path = tmp_path / "test.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-        catalog.add_book(
+        LibraryCatalog(memory_library).add_book(
             BookMetadata(title="Test Book", source_path=Path("/test.epub")),
             file_hash="hash1",
         )
-        conn.close()
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["tag", "rm", "1", "nope", "--db", str(db_path)])
+        assert run_tag_rm(memory_library, 1, "nope") == 1
+        assert "not found" in capsys.readouterr().out
+
+    def test_tag_rm_cli_exit_code(self, runner: CliRunner, library_db: Path) -> None:
+        """The Click command maps a failed removal to exit code 1."""
+        result = runner.invoke(cli, ["tag", "rm", "1", "nope", "--db", str(library_db)])
         assert result.exit_code == 1
         assert "not found" in result.output
 
@@ -82,48 +85,51 @@ class TestTagRm:
 class TestTagLs:
     """Tests for `bookery tag ls`."""
 
-    def test_tag_ls_empty(self, tmp_path: Path) -> None:
+    def test_tag_ls_empty(
+        self, memory_library: sqlite3.Connection, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Listing tags when none exist shows appropriate message."""
-        db_path = tmp_path / "test.db"
-        open_library(db_path).close()
+        assert run_tag_ls(memory_library) == 0
+        assert "No tags" in capsys.readouterr().out
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["tag", "ls", "--db", str(db_path)])
-        assert result.exit_code == 0
-        assert "No tags" in result.output
-
-    def test_tag_ls_shows_tags_with_counts(self, tmp_path: Path) -> None:
+    def test_tag_ls_shows_tags_with_counts(
+        self, memory_library: sqlite3.Connection, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Listing tags shows tag names and book counts."""
-        db_path = tmp_path / "test.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-        id1 = catalog.add_book(
-            BookMetadata(title="Book A", source_path=Path("/a.epub")),
-            file_hash="hash_a",
-        )
-        id2 = catalog.add_book(
-            BookMetadata(title="Book B", source_path=Path("/b.epub")),
-            file_hash="hash_b",
-        )
-        catalog.add_tag(id1, "fiction")
-        catalog.add_tag(id2, "fiction")
-        catalog.add_tag(id1, "mystery")
-        conn.close()
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["tag", "ls", "--db", str(db_path)])
+        catalog = LibraryCatalog(memory_library)
+        with catalog.bulk():
+            id1 = catalog.add_book(
+                BookMetadata(title="Book A", source_path=Path("/a.epub")),
+                file_hash="hash_a",
+            )
+            id2 = catalog.add_book(
+                BookMetadata(title="Book B", source_path=Path("/b.epub")),
+                file_hash="hash_b",
+            )
+            catalog.add_tag(id1, "fiction")
+            catalog.add_tag(id2, "fiction")
+            catalog.add_tag(id1, "mystery")
+
+        assert run_tag_ls(memory_library) == 0
+        output = capsys.readouterr().out
+        assert "fiction" in output
+        assert "mystery" in output
+
+    def test_tag_ls_cli(self, runner: CliRunner, library_db: Path) -> None:
+        """The Click command opens the --db path and exits cleanly."""
+        result = runner.invoke(cli, ["tag", "ls", "--db", str(library_db)])
         assert result.exit_code == 0
-        assert "fiction" in result.output
-        assert "mystery" in result.output
+        assert "No tags" in result.output
 
 
 class TestInfoShowsTags:
     """Tests for tags display in `bookery info`."""
 
-    def test_info_shows_tags(self, tmp_path: Path) -> None:
+    def test_info_shows_tags(
+        self, runner: CliRunner, library_db: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """Info command displays tags for a book."""
-        db_path = tmp_path / "test.db"
-        conn = open_library(db_path)
+        conn = open_seed_library(library_db)
         catalog = LibraryCatalog(conn)
         catalog.add_book(
             BookMetadata(title="Test Book", source_path=Path("/test.epub")),
@@ -131,27 +137,24 @@ class TestInfoShowsTags:
         )
         catalog.add_tag(1, "fiction")
         catalog.add_tag(1, "mystery")
-        conn.close()
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["info", "1", "--db", str(db_path)])
+        result = runner.invoke(cli, ["info", "1", "--db", str(library_db)])
         assert result.exit_code == 0
         assert "fiction" in result.output
         assert "mystery" in result.output
 
-    def test_info_no_tags_shows_none(self, tmp_path: Path) -> None:
+    def test_info_no_tags_shows_none(
+        self, runner: CliRunner, library_db: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """Info command shows no tags row when book has no tags."""
-        db_path = tmp_path / "test.db"
-        conn = open_library(db_path)
+        conn = open_seed_library(library_db)
         catalog = LibraryCatalog(conn)
         catalog.add_book(
             BookMetadata(title="Test Book", source_path=Path("/test.epub")),
             file_hash="hash1",
         )
-        conn.close()
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["info", "1", "--db", str(db_path)])
+        result = runner.invoke(cli, ["info", "1", "--db", str(library_db)])
         assert result.exit_code == 0
         # "Tags" row should not appear when there are no tags
         assert "Tags" not in result.output
@@ -160,10 +163,11 @@ class TestInfoShowsTags:
 class TestLsTagFilter:
     """Tests for --tag filter on `bookery ls`."""
 
-    def test_ls_filter_by_tag(self, tmp_path: Path) -> None:
+    def test_ls_filter_by_tag(
+        self, runner: CliRunner, library_db: Path, open_seed_library: OpenLibrary
+    ) -> None:
         """ls --tag filters to only books with that tag."""
-        db_path = tmp_path / "test.db"
-        conn = open_library(db_path)
+        conn = open_seed_library(library_db)
         catalog = LibraryCatalog(conn)
         id1 = catalog.add_book(
             BookMetadata(title="Fiction Book", source_path=Path("/f.epub")),
@@ -174,20 +178,15 @@ class TestLsTagFilter:
             file_hash="hash_o",
         )
         catalog.add_tag(id1, "fiction")
-        conn.close()
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["ls", "--tag", "fiction", "--db", str(db_path)])
+        result = runner.invoke(cli, ["ls", "--tag", "fiction", "--db", str(library_db)])
         assert result.exit_code == 0
         assert "Fiction Book" in result.output
         assert "Other Book" not in result.output
 
-    def test_ls_filter_by_nonexistent_tag(self, tmp_path: Path) -> None:
+    def test_ls_filter_by_nonexistent_tag(self, runner: CliRunner, library_db: Path) -> None:
         """ls --tag with a nonexistent tag shows error."""
-        db_path = tmp_path / "test.db"
-        open_library(db_path).close()
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["ls", "--tag", "nope", "--db", str(db_path)])
+        result = runner.invoke(cli, ["ls", "--tag", "nope", "--db", str(library_db)])
         assert result.exit_code == 1
         assert "not found" in result.output
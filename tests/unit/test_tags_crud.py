@@ -1,20 +1,19 @@
 # ABOUTME: Unit tests for tag CRUD operations on LibraryCatalog.
 # ABOUTME: Validates add, remove, list, and query methods for the tagging system.
 
+import sqlite3
 from pathlib import Path
 
 import pytest
 
 from bookery.db.catalog import LibraryCatalog
-from bookery.db.connection import open_library
 from bookery.metadata.types import BookMetadata
 
 
 @pytest.fixture()
-def catalog(tmp_path: Path) -> LibraryCatalog:
-    """Provide a LibraryCatalog backed by a temporary database."""
-    conn = open_library(tmp_path / "tags_test.db")
-    return LibraryCatalog(conn)
+def catalog(memory_library: sqlite3.Connection) -> LibraryCatalog:
+    """Provide a LibraryCatalog backed by an in-memory database."""
+    return LibraryCatalog(memory_library)
 
 
 @pytest.fixture()
@@ -29,32 +28,23 @@ def book_id(catalog: LibraryCatalog) -> int:
 class TestAddTag:
     """Tests for LibraryCatalog.add_tag()."""
 
-    def test_add_tag_to_book(self, catalog: LibraryCatalog, book_id: int) -> None:
-        """Adding a tag associates it with the book."""
-        catalog.add_tag(book_id, "fiction")
-        tags = catalog.get_tags_for_book(book_id)
-        assert tags == ["fiction"]
-
-    def test_add_multiple_tags(self, catalog: LibraryCatalog, book_id: int) -> None:
-        """Multiple tags can be added to a single book."""
-        catalog.add_tag(book_id, "fiction")
-        catalog.add_tag(book_id, "mystery")
-        tags = catalog.get_tags_for_book(book_id)
-        assert tags == ["fiction", "mystery"]
-
-    def test_add_tag_is_idempotent(self, catalog: LibraryCatalog, book_id: int) -> None:
-        """Adding the same tag twice does not raise or duplicate."""
-        catalog.add_tag(book_id, "fiction")
-        catalog.add_tag(book_id, "fiction")
-        tags = catalog.get_tags_for_book(book_id)
-        assert tags == ["fiction"]
-
-    def test_add_tag_case_insensitive(self, catalog: LibraryCatalog, book_id: int) -> None:
-        """Tags with different cases are treated as the same tag."""
-        catalog.add_tag(book_id, "Fiction")
-        catalog.add_tag(book_id, "fiction")
-        tags = catalog.get_tags_for_book(book_id)
-        assert len(tags) == 1
+    @pytest.mark.parametrize(
+        ("tags_to_add", "expected"),
+        [
+            pytest.param(["fiction"], ["fiction"], id="single"),
+            pytest.param(["fiction", "mystery"], ["fiction", "mystery"], id="multiple"),
+            pytest.param(["fiction", "fiction"], ["fiction"], id="idempotent"),
+            # Tags differing only in case are one tag; the first spelling is kept
+            pytest.param(["Fiction", "fiction"], ["Fiction"], id="case-insensitive"),
+        ],
+    )
+    def test_add_tags(
+        self, catalog: LibraryCatalog, book_id: int, tags_to_add: list[str], expected: list[str]
+    ) -> None:
+        """Added tags are associated with the book, without duplicates."""
+        for tag_name in tags_to_add:
+            catalog.add_tag(book_id, tag_name)
+        assert catalog.get_tags_for_book(book_id) == expected
 
     def test_add_tag_invalid_book_raises(self, catalog: LibraryCatalog) -> None:
         """Adding a tag to a nonexistent book raises ValueError."""
@@ -113,35 +103,36 @@ class TestListTags:
         """An empty library returns no tags."""
         assert catalog.list_tags() == []
 
-    def test_list_tags_with_counts(self, catalog: LibraryCatalog) -> None:
-        """list_tags returns tag names with book counts."""
-        id1 = catalog.add_book(
-            BookMetadata(title="Book A", source_path=Path("/a.epub")),
-            file_hash="hash_a",
-        )
-        id2 = catalog.add_book(
-            BookMetadata(title="Book B", source_path=Path("/b.epub")),
-            file_hash="hash_b",
-        )
-        catalog.add_tag(id1, "fiction")
-        catalog.add_tag(id2, "fiction")
-        catalog.add_tag(id1, "mystery")
-
-        result = catalog.list_tags()
-        assert ("fiction", 2) in result
-        assert ("mystery", 1) in result
-
-    def test_list_tags_alphabetical(self, catalog: LibraryCatalog) -> None:
-        """Tags are returned in alphabetical order."""
-        book_id = catalog.add_book(
-            BookMetadata(title="Book", source_path=Path("/b.epub")),
-            file_hash="hash_b",
-        )
-        catalog.add_tag(book_id, "zebra")
-        catalog.add_tag(book_id, "alpha")
-        result = catalog.list_tags()
-        names = [name for name, _ in result]
-        assert names == ["alpha", "zebra"]
+    @pytest.mark.parametrize(
+        ("tags_per_book", "expected"),
+        [
+            pytest.param(
+                [["fiction", "mystery"], ["fiction"]],
+                [("fiction", 2), ("mystery", 1)],
+                id="counts",
+            ),
+            pytest.param([["zebra", "alpha"]], [("alpha", 1), ("zebra", 1)], id="alphabetical"),
+        ],
+    )
+    def test_list_tags(
+        self,
+        catalog: LibraryCatalog,
+        tags_per_book: list[list[str]],
+        expected: list[tuple[str, int]],
+    ) -> None:
+        """list_tags returns tag names with book counts, alphabetically."""
+        with catalog.bulk():
+            book_ids = catalog.add_books_bulk(
+                [
+                    (BookMetadata(title=f"Book {i}", source_path=Path(f"/{i}.epub")), f"hash_{i}")
+                    for i in range(len(tags_per_book))
+                ]
+            )
+            for book_id, tags in zip(book_ids, tags_per_book, strict=True):
+                for tag_name in tags:
+                    catalog.add_tag(book_id, tag_name)
+
+        assert catalog.list_tags() == expected
 
 
 class TestGetBooksByTag:
@@ -149,16 +140,15 @@ class TestGetBooksByTag:
 
     def test_get_books_by_tag(self, catalog: LibraryCatalog) -> None:
         """Returns all books with the given tag."""
-        id1 = catalog.add_book(
-            BookMetadata(title="Book A", source_path=Path("/a.epub")),
-            file_hash="hash_a",
-        )
-        id2 = catalog.add_book(
-            BookMetadata(title="Book B", source_path=Path("/b.epub")),
-            file_hash="hash_b",
-        )
-        catalog.add_tag(id1, "fiction")
-        catalog.add_tag(id2, "fiction")
+        with catalog.bulk():
+            id1, id2 = catalog.add_books_bulk(
+                [
+                    (BookMetadata(title="Book A", source_path=Path("/a.epub")), "hash_a"),
+                    (BookMetadata(title="Book B", source_path=Path("/b.epub")), "hash_b"),
+                ]
+            )
+            catalog.add_tag(id1, "fiction")
+            catalog.add_tag(id2, "fiction")
 
         results = catalog.get_books_by_tag("fiction")
         assert len(results) == 2
@@ -1,6 +1,8 @@
 # ABOUTME: Unit tests for the library verification logic.
 # ABOUTME: Validates file existence checks, hash verification, and result aggregation.
 
+import sqlite3
+from collections.abc import Callable
 from pathlib import Path
 from typing import cast
 
@@ -8,34 +10,66 @@ import pytest
 
 from bookery.core.verifier import VerifyResult, verify_library
 from bookery.db.catalog import LibraryCatalog
-from bookery.db.connection import open_library
+from bookery.db.hashing import compute_file_hash
 from bookery.db.mapping import BookRecord
 from bookery.metadata.types import BookMetadata
+from tests.fixtures.catalog_types import MakeCatalog
 
+SnapshotCatalog = Callable[..., LibraryCatalog]
 
-@pytest.fixture()
-def catalog_with_books(tmp_path: Path):
-    """Create a catalog with books that have real source files."""
-    db_path = tmp_path / "verify_test.db"
-    conn = open_library(db_path)
+# One book per verify scenario. The stored hashes are placeholders, so none
+# of them match their source file.
+_SNAPSHOT_BOOKS = (
+    ("Book A", "a.epub", None),
+    ("Book B", "b.epub", None),
+    ("Ghost Book", None, None),
+    ("Outputless Book", "a.epub", Path("/nonexistent/output.epub")),
+)
+
+
+@pytest.fixture(scope="module")
+def verify_snapshot(_library_db_template: bytes, dummy_sources: Path) -> bytes:
+    """Serialized catalog holding every book in ``_SNAPSHOT_BOOKS``, built once per module.
+
+    Sources named None point at a path that doesn't exist.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.deserialize(_library_db_template)
+    conn.row_factory = sqlite3.Row
     catalog = LibraryCatalog(conn)
+    with catalog.bulk():
+        for title, source_name, output_path in _SNAPSHOT_BOOKS:
+            source = (
+                dummy_sources / source_name if source_name else Path("/nonexistent/ghost.epub")
+            )
+            catalog.add_book(
+                BookMetadata(title=title, source_path=source), f"hash_{title}", output_path
+            )
+    data = conn.serialize()
+    conn.close()
+    return data
 
-    # Create real source files
-    source_a = tmp_path / "a.epub"
-    source_a.write_text("content a")
-    source_b = tmp_path / "b.epub"
-    source_b.write_text("content b")
 
-    catalog.add_book(
-        BookMetadata(title="Book A", source_path=source_a),
-        file_hash="hash_a",
-    )
-    catalog.add_book(
-        BookMetadata(title="Book B", source_path=source_b),
-        file_hash="hash_b",
-    )
+@pytest.fixture()
+def snapshot_catalog(
+    verify_snapshot: bytes, memory_library: sqlite3.Connection
+) -> SnapshotCatalog:
+    """Factory returning a catalog restored from the snapshot with only the given titles.
+
+    Restoring is one page copy into ``memory_library``; the unwanted rows are
+    then deleted rather than the wanted ones re-inserted.
+    """
 
-    return catalog
+    def _make(*titles: str) -> LibraryCatalog:
+        memory_library.deserialize(verify_snapshot)
+        placeholders = ", ".join("?" for _ in titles)
+        with memory_library:
+            memory_library.execute(
+                f"DELETE FROM books WHERE title NOT IN ({placeholders})", titles
+            )
+        return LibraryCatalog(memory_library)
+
+    return _make
 
 
 class TestVerifyResult:
@@ -62,82 +96,39 @@ class TestVerifyResult:
 class TestVerifyLibrary:
     """Tests for verify_library()."""
 
-    def test_all_files_present(self, catalog_with_books: LibraryCatalog) -> None:
+    def test_all_files_present(self, snapshot_catalog: SnapshotCatalog) -> None:
         """Verify succeeds when all source files exist."""
-        result = verify_library(catalog_with_books)
+        result = verify_library(snapshot_catalog("Book A", "Book B"))
         assert result.ok == 2
         assert result.missing_source == []
 
-    def test_missing_source_detected(self, tmp_path: Path) -> None:
+    def test_missing_source_detected(self, snapshot_catalog: SnapshotCatalog) -> None:
         """Books with missing source_path are flagged."""
-        db_path = tmp_path / "missing.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-
-        catalog.add_book(
-            BookMetadata(title="Ghost Book", source_path=Path("/nonexistent/ghost.epub")),
-            file_hash="ghost_hash",
-        )
-
-        result = verify_library(catalog)
+        result = verify_library(snapshot_catalog("Ghost Book"))
         assert result.ok == 0
         assert len(result.missing_source) == 1
         assert result.missing_source[0].metadata.title == "Ghost Book"
 
-    def test_missing_output_detected(self, tmp_path: Path) -> None:
+    def test_missing_output_detected(self, snapshot_catalog: SnapshotCatalog) -> None:
         """Books with output_path set but file missing are flagged."""
-        db_path = tmp_path / "output.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-
-        source = tmp_path / "real.epub"
-        source.write_text("real content")
-
-        book_id = catalog.add_book(
-            BookMetadata(title="Outputless Book", source_path=source),
-            file_hash="real_hash",
-        )
-        catalog.set_output_path(book_id, Path("/nonexistent/output.epub"))
-
-        result = verify_library(catalog)
+        result = verify_library(snapshot_catalog("Outputless Book"))
         assert result.ok == 0
         assert len(result.missing_output) == 1
         assert result.missing_output[0].metadata.title == "Outputless Book"
 
-    def test_no_output_path_is_ok(self, tmp_path: Path) -> None:
+    def test_no_output_path_is_ok(self, snapshot_catalog: SnapshotCatalog) -> None:
         """Books without output_path are not flagged for missing output."""
-        db_path = tmp_path / "noout.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-
-        source = tmp_path / "ok.epub"
-        source.write_text("ok content")
-
-        catalog.add_book(
-            BookMetadata(title="No Output", source_path=source),
-            file_hash="ok_hash",
-        )
-
-        result = verify_library(catalog)
+        result = verify_library(snapshot_catalog("Book A"))
         assert result.ok == 1
         assert result.missing_output == []
 
-    def test_hash_mismatch_detected(self, tmp_path: Path) -> None:
+    def test_hash_mismatch_detected(self, tmp_path: Path, make_catalog: MakeCatalog) -> None:
         """Books with changed source file are flagged when check_hash=True."""
-        db_path = tmp_path / "hashcheck.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-
         source = tmp_path / "changed.epub"
         source.write_text("original content")
 
-        from bookery.db.hashing import compute_file_hash
-
-        original_hash = compute_file_hash(source)
-
-        catalog.add_book(
-            BookMetadata(title="Changed Book", source_path=source),
-            file_hash=original_hash,
+        catalog = make_catalog(
+            (BookMetadata(title="Changed Book", source_path=source), compute_file_hash(source)),
         )
 
         # Modify the file after import
@@ -147,47 +138,21 @@ class TestVerifyLibrary:
         assert len(result.hash_mismatch) == 1
         assert result.hash_mismatch[0].metadata.title == "Changed Book"
 
-    def test_hash_check_skipped_by_default(self, tmp_path: Path) -> None:
+    def test_hash_check_skipped_by_default(self, snapshot_catalog: SnapshotCatalog) -> None:
         """Hash checking is off by default — modified files are not flagged."""
-        db_path = tmp_path / "nohash.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-
-        source = tmp_path / "maybe.epub"
-        source.write_text("original")
-
-        catalog.add_book(
-            BookMetadata(title="Unchecked", source_path=source),
-            file_hash="stale_hash",
-        )
-
-        source.write_text("modified")
-
-        result = verify_library(catalog)
+        # Book A's stored hash doesn't match its file, as if it changed after import
+        result = verify_library(snapshot_catalog("Book A"))
         assert result.hash_mismatch == []
         assert result.ok == 1
 
-    def test_hash_check_skips_missing_source(self, tmp_path: Path) -> None:
+    def test_hash_check_skips_missing_source(self, snapshot_catalog: SnapshotCatalog) -> None:
         """Hash check doesn't fail if source file is already missing."""
-        db_path = tmp_path / "skip.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-
-        catalog.add_book(
-            BookMetadata(title="Gone", source_path=Path("/gone/book.epub")),
-            file_hash="gone_hash",
-        )
-
-        result = verify_library(catalog, check_hash=True)
+        result = verify_library(snapshot_catalog("Ghost Book"), check_hash=True)
         assert len(result.missing_source) == 1
         assert result.hash_mismatch == []
 
-    def test_empty_library(self, tmp_path: Path) -> None:
+    def test_empty_library(self, memory_library: sqlite3.Connection) -> None:
         """Verifying an empty library returns clean result."""
-        db_path = tmp_path / "empty.db"
-        conn = open_library(db_path)
-        catalog = LibraryCatalog(conn)
-
-        result = verify_library(catalog)
+        result = verify_library(LibraryCatalog(memory_library))
         assert result.ok == 0
         assert result.total_issues == 0